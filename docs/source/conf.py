@@ -6,11 +6,6 @@
 # -- Project information -----------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#project-information
 
-import os
-import sys
-
-sys.path.insert(0, os.path.abspath("../.."))  # point to your package root
-
 project = 'Lizzy'
 copyright = '2025-2026, Simone Bancora, Paris Mulye'
 author = 'Simone Bancora'
@@ -20,7 +15,7 @@ author = 'Simone Bancora'
 
 extensions = [
     'sphinx.ext.napoleon',
-    'sphinx.ext.autodoc',
+    'autoapi.extension',
     'sphinxcontrib.bibtex',
 ]
 
@@ -42,12 +37,13 @@ html_theme = 'sphinx_rtd_theme'
 napoleon_google_docstring = False
 napoleon_numpy_docstring = True
 
-# autodoc_default_options = {
-#     "members": False,
-#     "undoc-members": False,
-#     "show-inheritance": False,
-#     "autosummary": False,
-# }
-# autodoc_class_attributes = True
+# AutoAPI parses the sources statically, so the package and its numerical
+# dependencies do not need to be importable at documentation build time.
+# The API reference pages are written by hand with the autoapi* directives.
+autoapi_type = 'python'
+autoapi_dirs = ['../../src/lizzy']
+autoapi_options = ['members', 'show-inheritance', 'show-module-summary', 'imported-members']
+autoapi_generate_api_docs = False
+autoapi_add_toctree_entry = False
 
 latex_engine = 'xelatex'
\ No newline at end of file
@@ -10,11 +10,25 @@ Available solvers:
 - DIRECT_SPARSE: Direct solver using sparse matrix factorization (recommended for small/medium meshes)
 - DIRECT_DENSE: Direct solver using dense matrices (only for very small problems)
 - ITERATIVE_PETSC: Iterative solver using PETSc library (recommended for large meshes)
+
+Any extra keyword passed to initialise_solver() with ITERATIVE_PETSC is forwarded
+to the PETSc options database, which allows tuning the preconditioner (Example 4).
 """
 
 import time
 import lizzy as liz
 
+
+def petsc_has_hypre():
+    """True if petsc4py imports and PETSc was built with hypre (needed by pc_type="hypre")."""
+    try:
+        import petsc4py
+        petsc4py.init()
+        from petsc4py import PETSc
+    except (ImportError, RuntimeError):
+        return False
+    return PETSc.Sys.hasExternalPackage("hypre")
+
 # =============================================================================
 # Model Setup (common for all solvers)
 # =============================================================================
@@ -100,6 +114,38 @@ print(f"Fill time: {solution_petsc.time[-1]:.2f} s")
 print(f"Number of time steps: {len(solution_petsc.time)}")
 print(f"Solver runtime: {time_petsc:.2f} s")
 
+# =============================================================================
+# Example 4: PETSc GMRES(30) + hypre BoomerAMG (skipped unless PETSc was built with hypre)
+# =============================================================================
+solution_hypre = None
+if petsc_has_hypre():
+    print("\n" + "="*60)
+    print("Running with ITERATIVE_PETSC solver (GMRES + BoomerAMG)")
+    print("="*60)
+
+    model.initialise_solver(
+        solver_type=liz.SolverType.ITERATIVE_PETSC,
+        solver_tol=1e-8,
+        ksp_type="gmres",
+        pc_type="hypre",
+        ksp_gmres_restart=30,
+        ksp_norm_type="unpreconditioned",          # same residual definition for every preconditioner
+        pc_hypre_type="boomeramg",
+        pc_hypre_boomeramg_strong_threshold=0.5,
+        pc_hypre_boomeramg_coarsen_type="HMIS",
+        pc_hypre_boomeramg_interp_type="ext+i",
+        pc_hypre_boomeramg_agg_nl=1,
+    )
+    start_time = time.time()
+    solution_hypre = model.solve()
+    time_hypre = time.time() - start_time
+
+    print(f"Fill time: {solution_hypre.time[-1]:.2f} s")
+    print(f"Number of time steps: {len(solution_hypre.time)}")
+    print(f"Solver runtime: {time_hypre:.2f} s")
+else:
+    print("\nSkipping GMRES + BoomerAMG: PETSc is not available or was not built with hypre.")
+
 # =============================================================================
 # Compare Results
 # =============================================================================
@@ -111,6 +157,8 @@ print("-"*50)
 print(f"{'DIRECT_SPARSE':<20} {solution_sparse.time[-1]:<15.4f} {time_sparse:<15.2f}")
 print(f"{'DIRECT_DENSE':<20} {solution_dense.time[-1]:<15.4f} {time_dense:<15.2f}")
 print(f"{'ITERATIVE_PETSC':<20} {solution_petsc.time[-1]:<15.4f} {time_petsc:<15.2f}")
+if solution_hypre is not None:
+    print(f"{'PETSC_BOOMERAMG':<20} {solution_hypre.time[-1]:<15.4f} {time_hypre:<15.2f}")
 
 # Save results from one of the solutions
 model.save_results(solution_sparse, "solver_comparison")
@@ -4,4 +4,5 @@
 #  This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
 #  You should have received a copy of the GNU General Public License along with this program. If not, see <https://www.gnu.org/licenses/>.
 
-from .mesh import Mesh
\ No newline at end of file
+from .mesh import Mesh
+from .entities import Node, Line, Triangle, CV
\ No newline at end of file
@@ -16,7 +16,11 @@ class MeshView:
         self.n_lines:int=0
         self.n_triangles:int=0
         self.node_idx_to_node_idxs: list[np.ndarray] = []
+        self.node_idx_to_node_idxs_flat: np.ndarray = None
+        self.node_idx_to_node_idxs_offsets: np.ndarray = None
         self.node_idx_to_tri_idxs: list[np.ndarray] = []
+        self.node_idx_to_tri_idxs_flat: np.ndarray = None
+        self.node_idx_to_tri_idxs_offsets: np.ndarray = None
         self.node_idx_to_flux_ndarray: list[np.ndarray] = []
         self.phys_boundary_names_set:set[str] = set()
         self.phys_boundary_name_to_node_idxs:dict = {} #for dirichlet mostly
@@ -31,8 +35,11 @@ class MeshBuilder:
         self.n_triangles = 0
         self.n_lines = 0
         self.node_idx_to_node_idxs = None
+        self.node_idx_to_node_idxs_flat = None
+        self.node_idx_to_node_idxs_offsets = None
         self.node_idx_to_line_idxs = None
-        self.node_idx_to_tri_idxs_buffer = None
+        self.node_idx_to_tri_idxs_flat = None
+        self.node_idx_to_tri_idxs_offsets = None
         self.node_idx_to_tri_idxs = None
 
         self.line_idx_to_node_idxs = None
@@ -47,12 +54,8 @@ class MeshBuilder:
 
     
     def create_cross_referencing_maps(self, n_nodes, n_lines, n_triangles, tri_conn, physical_lines_conn):
-        capacity_tris_per_node = 8 # initial buffer size
-        node_idx_to_tri_idxs_buffer = np.full((n_nodes, capacity_tris_per_node), -1, dtype=np.int32)
-        tri_idxs_local_pointer = np.zeros(n_nodes, dtype=np.uint8)
         triangle_idx_to_line_idxs = np.empty((n_triangles, 3), dtype=np.uint32)
         line_idx_to_node_idxs = np.empty((n_lines, 2), dtype=np.uint32)
-        boundary_line_idx_to_tri_idx = np.full(len(physical_lines_conn), -1, dtype=np.int32)
 
         line_nodes_from_conn_selectors = [[0,1],[1,2],[2,0]]
         for tri_id in range(n_triangles):
@@ -67,31 +70,11 @@ class MeshBuilder:
             
                 # populate `triangle_idx_to_line_idxs`
                 triangle_idx_to_line_idxs[tri_id, j] = line_idx
-
-            # populate `node_idx_to_tri_idxs_buffer`
-            for local_node_id_selector in range(3):
-                node_id = local_conn[local_node_id_selector]
-                # check if we still have room for more ids
-                if tri_idxs_local_pointer[node_id] > capacity_tris_per_node - 1:
-                    # increase bufefr size
-                    capacity_tris_per_node *=2
-                    node_idx_to_tri_idxs_buffer = np.resize(node_idx_to_tri_idxs_buffer, (n_nodes, capacity_tris_per_node))
-                # write the triangle id in the buffer (which is initially 5 tris per node)
-                node_idx_to_tri_idxs_buffer[node_id, tri_idxs_local_pointer[node_id]] = tri_id
-                # move local pointer
-                tri_idxs_local_pointer[node_id] +=1
-            
-            # populate "boundary_line_idx_to_tri_idx"
-            tri_node_ids_set = set(local_conn)
-            for i in range(len(physical_lines_conn)):
-                line_ids_set = set(physical_lines_conn[i])
-                if line_ids_set.issubset(tri_node_ids_set):
-                    boundary_line_idx_to_tri_idx[i] = tri_id
-                    break
         
+        boundary_line_idx_to_tri_idx = self.find_boundary_line_triangles(n_nodes, tri_conn, physical_lines_conn)
          
         # store
-        self.node_idx_to_tri_idxs_buffer = node_idx_to_tri_idxs_buffer
+        self.node_idx_to_tri_idxs_flat, self.node_idx_to_tri_idxs_offsets = self.build_node_to_triangle_map(n_nodes, tri_conn)
         self.line_idx_to_node_idxs = line_idx_to_node_idxs
         self.triangle_idx_to_node_idxs = tri_conn
         self.triangle_idx_to_line_idxs = triangle_idx_to_line_idxs
@@ -137,24 +120,87 @@ class MeshBuilder:
 
 
 
+    def find_boundary_line_triangles(self, n_nodes, tri_conn, physical_lines_conn):
+        """
+        Find the triangle each boundary line belongs to, by matching its node pair against the edges of all triangles.
+
+        Returns
+        -------
+        np.ndarray
+            Triangle index of each boundary line, -1 where no triangle has that edge.
+        """
+        tri_conn = np.asarray(tri_conn, dtype=np.int64)
+        lines_conn = np.asarray(physical_lines_conn, dtype=np.int64).reshape(-1, 2)
+        # key each edge by its sorted node pair, so both orientations match
+        tri_edges = np.stack((tri_conn[:, [0, 1]], tri_conn[:, [1, 2]], tri_conn[:, [2, 0]]), axis=1).reshape(-1, 2)
+        tri_edge_keys = tri_edges.min(axis=1) * n_nodes + tri_edges.max(axis=1)
+        line_keys = lines_conn.min(axis=1) * n_nodes + lines_conn.max(axis=1)
+        order = np.argsort(tri_edge_keys, kind="stable")
+        sorted_keys = tri_edge_keys[order]
+        pos = np.searchsorted(sorted_keys, line_keys, side="right") - 1
+        found = (pos >= 0) & (sorted_keys[np.maximum(pos, 0)] == line_keys)
+        boundary_line_idx_to_tri_idx = np.full(len(lines_conn), -1, dtype=np.int32)
+        boundary_line_idx_to_tri_idx[found] = order[pos[found]] // 3
+        return boundary_line_idx_to_tri_idx
+
+    def build_node_to_triangle_map(self, n_nodes, tri_conn):
+        """
+        Build the node-to-triangle incidence of the mesh in CSR form.
+
+        Returns
+        -------
+        tri_idxs : np.ndarray
+            Flat array of triangle indices, sorted ascending within each node.
+        offsets : np.ndarray
+            Array of size n_nodes+1: the triangles around node ``i`` are ``tri_idxs[offsets[i]:offsets[i+1]]``.
+        """
+        node_idxs = np.asarray(tri_conn).ravel()
+        # a stable sort by node keeps the triangles of each node in ascending order
+        tri_idxs = (np.argsort(node_idxs, kind="stable") // 3).astype(np.int32)
+        offsets = np.zeros(n_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(node_idxs, minlength=n_nodes), out=offsets[1:])
+        return tri_idxs, offsets
+
+    def build_node_adjacency(self, n_nodes):
+        """
+        Build the node-to-node adjacency of the triangle mesh in CSR form.
+
+        Returns
+        -------
+        neighbours : np.ndarray
+            Flat array of neighbouring node indices, sorted ascending within each node.
+        offsets : np.ndarray
+            Array of size n_nodes+1: the neighbours of node ``i`` are ``neighbours[offsets[i]:offsets[i+1]]``.
+        """
+        tri_conn = np.asarray(self.triangle_idx_to_node_idxs, dtype=np.int64)
+        edges = np.vstack((tri_conn[:, [0, 1]], tri_conn[:, [1, 2]], tri_conn[:, [2, 0]]))
+        edges = np.vstack((edges, edges[:, ::-1]))
+        # degenerate triangles would make a node its own neighbour
+        edges = edges[edges[:, 0] != edges[:, 1]]
+        # interior edges appear twice (once per adjacent triangle): keep unique pairs, sorted by (source, target)
+        edges = np.unique(edges, axis=0)
+        offsets = np.zeros(n_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(edges[:, 0], minlength=n_nodes), out=offsets[1:])
+        return edges[:, 1], offsets
+
     def assign_varying_number_references(self, nodes:list[Node], triangles):
         node_idx_to_node_idxs = [None]*len(nodes)
         node_idx_to_tri_idxs = [None]*len(nodes)
+        neighbours, offsets = self.build_node_adjacency(len(nodes))
+        self.node_idx_to_node_idxs_flat, self.node_idx_to_node_idxs_offsets = neighbours, offsets
         
         for i in range(len(nodes)):
             # assign triangles to nodes (varying number)
-            tri_ids_buffer = self.node_idx_to_tri_idxs_buffer[i]
-            tri_ids = tri_ids_buffer[tri_ids_buffer >= 0]
-            node_idx_to_tri_idxs[i] = np.array(tri_ids)
+            tri_ids = self.node_idx_to_tri_idxs_flat[self.node_idx_to_tri_idxs_offsets[i]:self.node_idx_to_tri_idxs_offsets[i+1]]
+            node_idx_to_tri_idxs[i] = tri_ids
             nodes[i].triangle_ids = tri_ids
             triangle_objs = [triangles[idx] for idx in tri_ids]
             nodes[i].triangles = triangle_objs
 
-            connected_node_idxs = [idx for triangle in triangle_objs for idx in triangle.node_ids]
-            connected_node_idxs = list(set(connected_node_idxs)-{i})
-            nodes[i].node_ids = connected_node_idxs
-            nodes[i].nodes = [nodes[idx] for idx in connected_node_idxs]
-            node_idx_to_node_idxs[i] = np.array(connected_node_idxs)
+            connected_node_idxs = neighbours[offsets[i]:offsets[i+1]]
+            nodes[i].node_ids = connected_node_idxs.tolist()
+            nodes[i].nodes = [nodes[idx] for idx in nodes[i].node_ids]
+            node_idx_to_node_idxs[i] = connected_node_idxs
         self.node_idx_to_node_idxs = node_idx_to_node_idxs
         self.node_idx_to_tri_idxs = node_idx_to_tri_idxs
         return node_idx_to_node_idxs, node_idx_to_tri_idxs
@@ -181,7 +227,11 @@ class MeshBuilder:
         new_nodes, new_lines, new_triangles, new_boundary_lines = self.create_entities(n_nodes, n_triangles, n_lines, node_coords, tri_conn, physical_lines_conn, boundary_line_idx_to_tri_idx)
         node_idx_to_node_idxs, node_idx_to_tri_idxs = self.assign_varying_number_references(new_nodes, new_triangles)
         mesh_view.node_idx_to_node_idxs = node_idx_to_node_idxs
+        mesh_view.node_idx_to_node_idxs_flat = self.node_idx_to_node_idxs_flat
+        mesh_view.node_idx_to_node_idxs_offsets = self.node_idx_to_node_idxs_offsets
         mesh_view.node_idx_to_tri_idxs = node_idx_to_tri_idxs
+        mesh_view.node_idx_to_tri_idxs_flat = self.node_idx_to_tri_idxs_flat
+        mesh_view.node_idx_to_tri_idxs_offsets = self.node_idx_to_tri_idxs_offsets
         mesh_view.boundary_line_idx_to_tri_idx = boundary_line_idx_to_tri_idx
         cvs = self.create_control_volumes(new_nodes)
 
@@ -7,9 +7,6 @@
 
 
 from __future__ import annotations
-from typing import TYPE_CHECKING
-if TYPE_CHECKING:
-    from lizzy._core.cvmesh.entities import Node, Line, Triangle, CV
 import numpy as np
 
 
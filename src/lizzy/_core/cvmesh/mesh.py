@@ -40,6 +40,14 @@ class Mesh:
         self.CVs : list[CV] = []
         self.node_coords : np.ndarray = None
         self.tri_conn_table : np.ndarray = None
+        self.triangle_normals : np.ndarray = None
+        self.k_elem : np.ndarray = None
+        self.porosity_elem : np.ndarray = None
+        self.thickness_elem : np.ndarray = None
+        self.cv_areas : np.ndarray = None
+        self.cv_volumes : np.ndarray = None
+        self._cv_mesh_nodes : np.ndarray = None
+        self._cv_mesh_conn : np.ndarray = None
 
     # Init method:
     def build_mesh(self, mesh_data):
@@ -48,24 +56,116 @@ class Mesh:
         self.nodes, self.lines, self.boundary_lines, self.triangles, self.CVs, self.mesh_view = mb.build_mesh(mesh_data)
         self.node_coords = mesh_data['all_nodes_coords']
         self.tri_conn_table = mesh_data['nodes_conn']
+        self.gather_triangle_normals()
+        self._cv_mesh_nodes = None
+        self._cv_mesh_conn = None
+
+    @property
+    def cv_mesh_nodes(self) -> np.ndarray:
+        """End points of all CV boundary lines, shape (2L, 3). Built on first access, only needed to export the CV mesh.
+        """
+        if self._cv_mesh_nodes is None:
+            self._build_cv_mesh()
+        return self._cv_mesh_nodes
+
+    @property
+    def cv_mesh_conn(self) -> np.ndarray:
+        """Connectivity of the CV boundary lines, shape (L, 2), indexing into `cv_mesh_nodes`.
+        """
+        if self._cv_mesh_conn is None:
+            self._build_cv_mesh()
+        return self._cv_mesh_conn
+
+    def _build_cv_mesh(self):
+        n_cv_lines = sum(len(tri_lines) for cv in self.CVs for tri_lines in cv.cv_lines)
+        cv_mesh_nodes = np.empty((2*n_cv_lines, 3), dtype=np.float64)
+        i = 0
+        for cv in self.CVs:
+            for tri_lines in cv.cv_lines:
+                for line in tri_lines:
+                    cv_mesh_nodes[i] = line.p1
+                    cv_mesh_nodes[i+1] = line.p2
+                    i += 2
+        self._cv_mesh_nodes = cv_mesh_nodes
+        self._cv_mesh_conn = np.arange(2*n_cv_lines).reshape(n_cv_lines, 2)
     
+    def gather_triangle_normals(self):
+        """Packs the unit normals of all elements into the contiguous (M, 3) array `triangle_normals`. The `n` attribute of each triangle becomes a view on its row, so both always hold the same values.
+        """
+        self.triangle_normals = np.array([tri.n for tri in self.triangles], dtype=np.float64).reshape(-1, 3)
+        for tri, normal in zip(self.triangles, self.triangle_normals):
+            tri.n = normal
+
     def update_elements_with_assigned_material(self, element_idxs, material: PorousMaterial, rosette: Rosette):
-        for idx in element_idxs:
-            tri = self.triangles[idx]
-            if material.is_isotropic:
-                tri.k = material.k_princ
-            else:
-                u, v, w = rosette.project_along_normal(tri.n)
-                R = np.array([u, v, w]).T
-                tri.k = R @ material.k_princ @ R.T
-            tri.porosity = material.porosity
-            tri.h = material.thickness
+        triangles = self.triangles
+        porosity = material.porosity
+        thickness = material.thickness
+        if material.is_isotropic:
+            k_princ = material.k_princ
+            for idx in element_idxs:
+                tri = triangles[idx]
+                tri.k = k_princ
+                tri.porosity = porosity
+                tri.h = thickness
+                tri.material_assigned = True
+            return
+        # project the rosette on all elements at once, then rotate the permeability tensors in a single batched product
+        normals = self.triangle_normals[element_idxs]
+        R = np.stack(rosette.project_along_normals(normals), axis=2)
+        # R diag(k) R^T for every element, as one batched matmul
+        k_rotated = (R * material.k_diag) @ R.transpose(0, 2, 1)
+        for i, idx in enumerate(element_idxs):
+            tri = triangles[idx]
+            tri.k = k_rotated[i]
+            tri.porosity = porosity
+            tri.h = thickness
             tri.material_assigned = True
     
+    def gather_element_properties(self):
+        """Copies the permeability, porosity and thickness of all elements into contiguous arrays (k_elem, porosity_elem, thickness_elem) indexed by element idx. Element properties can be edited individually until the solver is initialised, so this is called by the preprocessor.
+        """
+        n_triangles = len(self.triangles)
+        self.k_elem = np.empty((n_triangles, 3, 3), dtype=np.float64)
+        self.porosity_elem = np.empty(n_triangles, dtype=np.float64)
+        self.thickness_elem = np.empty(n_triangles, dtype=np.float64)
+        for i, tri in enumerate(self.triangles):
+            self.k_elem[i] = tri.k
+            self.porosity_elem[i] = tri.porosity
+            self.thickness_elem[i] = tri.h
+
+    def compute_cv_areas_and_volumes(self):
+        """Computes the area and the pore volume of all control volumes at once and stores them in `cv_areas` and `cv_volumes`, indexed by node idx. The `A` and `vol` attributes of each CV are set too. Requires the element properties gathered by :func:`gather_element_properties`.
+
+        Each CV is made of one quadrilateral slice per support triangle (node, edge midpoint, centroid, edge midpoint), whose area is half the norm of the cross product of its diagonals.
+        """
+        mesh_view = self.mesh_view
+        tri_idxs = mesh_view.node_idx_to_tri_idxs_flat
+        counts = np.diff(mesh_view.node_idx_to_tri_idxs_offsets)
+        node_idxs = np.repeat(np.arange(mesh_view.n_nodes), counts)
+        conn = self.tri_conn_table[tri_idxs]
+        # the two other nodes of each support triangle
+        other_idxs = conn[conn != node_idxs[:, None]].reshape(-1, 2)
+        p_node = self.node_coords[node_idxs]
+        p_a = self.node_coords[other_idxs[:, 0]]
+        p_b = self.node_coords[other_idxs[:, 1]]
+        centroids = (p_node + p_a + p_b) / 3
+        # diagonals: node -> centroid and midpoint -> midpoint
+        slice_areas = 0.5 * np.linalg.norm(np.cross(centroids - p_node, 0.5 * (p_b - p_a)), axis=1)
+        slice_vols = slice_areas * self.thickness_elem[tri_idxs] * self.porosity_elem[tri_idxs]
+        segment_starts = mesh_view.node_idx_to_tri_idxs_offsets[:-1]
+        self.cv_areas = np.add.reduceat(slice_areas, segment_starts)
+        self.cv_volumes = np.add.reduceat(slice_vols, segment_starts)
+        for cv, area, vol in zip(self.CVs, self.cv_areas, self.cv_volumes):
+            cv.A = area
+            cv.vol = vol
+
     def assert_all_elements_have_material(self):
-        for tri in self.triangles:
-            if not tri.material_assigned:
-                raise MeshError(f"Element with id {tri.idx} does not have an assigned material. Check material assignments.")
+        assigned = np.fromiter((tri.material_assigned for tri in self.triangles), dtype=bool, count=len(self.triangles))
+        if assigned.all():
+            return
+        missing_idxs = np.flatnonzero(~assigned)
+        missing_tags = sorted({self.triangles[idx].material_tag for idx in missing_idxs})
+        raise MeshError(f"{len(missing_idxs)} elements (first id: {missing_idxs[0]}) do not have an assigned material, in mesh regions: {missing_tags}. Check material assignments.")
 
     def empty_cvs(self):
         for cv in self.CVs:
@@ -5,4 +5,4 @@
 #  You should have received a copy of the GNU General Public License along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 from .manager import GatesManager
-from .gates import PressureInlet
+from .gates import Inlet, PressureInlet, FlowRateInlet, Vent
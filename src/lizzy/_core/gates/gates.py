@@ -15,6 +15,8 @@ class InletType(Enum):
 class Inlet(ABC):
     """Abstract class representing an inlet. :class:`~lizzy.gates.PressureInlet` and :class:`~lizzy.gates.FlowRateInlet` derive from this class.
     """
+    __slots__ = ("_name", "_type", "_assigned", "_open")
+
     def __init__(self, name:str, inlet_type:InletType):
         super().__init__()
         self._name = name
@@ -54,6 +56,8 @@ class Inlet(ABC):
         self._open = open_state
 
 class PressureInlet(Inlet):
+    __slots__ = ("_p_value", "_p0")
+
     def __init__(self, name:str, p_value:float):
         super().__init__(name, InletType.PRESSURE)
         self._p_value = p_value
@@ -84,6 +88,8 @@ class PressureInlet(Inlet):
 
 
 class FlowRateInlet(Inlet):
+    __slots__ = ("_q_value", "_q0")
+
     def __init__(self, name:str, q_value:float):
         super().__init__(name, InletType.FLOW_RATE)
         self._q_value = q_value
@@ -113,6 +119,8 @@ class FlowRateInlet(Inlet):
 
 
 class Vent:
+    __slots__ = ("name", "_assigned", "_vacuum_pressure")
+
     def __init__(self, name:str, vacuum_pressure:float=0.0):
         """A class respresenting a vent boundary. Vent vacuum pressure will be applied to all non-filled regions in the domain.
 
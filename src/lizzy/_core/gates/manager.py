@@ -8,6 +8,12 @@ from .gates import Inlet, PressureInlet, FlowRateInlet, Vent
 from typing import Literal
 from lizzy.exceptions import ConfigurationError
 
+# maps each change_inlet_pressure mode to a function (current value, new value) -> pressure to set
+_PRESSURE_CHANGE_MODES = {
+    "set": lambda current_value, new_value: new_value,
+    "delta": lambda current_value, new_value: current_value + new_value,
+}
+
 class GatesManager:
     """Manager for all boundary condition operations.
     """
@@ -55,12 +61,10 @@ class GatesManager:
     def _fetch_inlet(self, inlet_selector:Inlet | str) -> Inlet:
         if isinstance(inlet_selector, Inlet):
             return inlet_selector
-        else:
-            try:
-                selected_inlet = self._created_inlets[inlet_selector]
-            except KeyError:
-                raise KeyError(f"Inlet '{inlet_selector}' is not found in existing inlets. Check the name, or create the inlet first.")
-            return selected_inlet
+        try:
+            return self._created_inlets[inlet_selector]
+        except KeyError:
+            raise KeyError(f"Inlet '{inlet_selector}' is not found in existing inlets. Check the name, or create the inlet first.")
 
     def assign_inlet(self, inlet_selector:Inlet | str, boundary_tag:str):
         #TODO: I dont like that the boundary tag is not checked against existing here. The check only happens at runtime by solver.
@@ -74,19 +78,17 @@ class GatesManager:
             An existing mesh boundary tag where to assign the inlet.
         """
         selected_inlet = self._fetch_inlet(inlet_selector)
-        if selected_inlet not in self._assigned_inlets.values():
+        if not selected_inlet._assigned:
             self._assigned_inlets[boundary_tag] = selected_inlet
             selected_inlet._assigned = True
     
     def _fetch_vent(self, vent_selector:Vent | str) -> Vent:
         if isinstance(vent_selector, Vent):
             return vent_selector
-        else:
-            try:
-                selected_vent = self._created_vents[vent_selector]
-            except KeyError:
-                raise KeyError(f"Vent '{vent_selector}' is not found in existing vents. Check the name, or create the vent first.")
-            return selected_vent
+        try:
+            return self._created_vents[vent_selector]
+        except KeyError:
+            raise KeyError(f"Vent '{vent_selector}' is not found in existing vents. Check the name, or create the vent first.")
 
     def assign_vent(self, vent_selector:Vent | str, boundary_tag:str):
         """Selects a vent from existing ones and assigns it to the indicated mesh boundary.
@@ -99,7 +101,7 @@ class GatesManager:
             An existing mesh boundary tag where to assign the vent.
         """
         selected_vent = self._fetch_vent(vent_selector)
-        if selected_vent not in self._assigned_vents.values():
+        if not selected_vent._assigned:
             if len(self._assigned_vents) > 0:
                 raise ConfigurationError("Multiple vents assigned to the model. Currently only one vent is supported.")
             self._assigned_vents[boundary_tag] = selected_vent
@@ -108,13 +110,11 @@ class GatesManager:
     # TODO: functionality should be added to change the pressure over time, along different time interpolation options
     def change_inlet_pressure(self, inlet_selector:Inlet | str, pressure_value:float, mode: Literal["set", "delta"] = "set"):
         selected_inlet = self._fetch_inlet(inlet_selector)
-        match mode:
-            case "set":
-                selected_inlet.p_value = pressure_value
-            case "delta":
-                selected_inlet.p_value += pressure_value
-            case _:
-                raise ValueError(f"Invalid mode '{mode}'. Must be 'set' or 'delta'.")
+        try:
+            apply_mode = _PRESSURE_CHANGE_MODES[mode]
+        except KeyError:
+            raise ValueError(f"Invalid mode '{mode}'. Must be 'set' or 'delta'.")
+        selected_inlet.p_value = apply_mode(selected_inlet.p_value, pressure_value)
 
     def open_inlet(self, inlet_selector:Inlet | str):
         selected_inlet = self._fetch_inlet(inlet_selector)
@@ -71,25 +71,28 @@ class Reader:
         all_nodes_coords : np.ndarray = mesh_file.points
         physical_domain_names = []
         physical_line_names = []
-        nodes_conn = mesh_file.cells_dict["triangle"]
+        # meshio rebuilds cells_dict and cell_sets_dict, concatenating every cell block, at each access: read them once
+        cells_dict = mesh_file.cells_dict
+        cell_sets_dict = mesh_file.cell_sets_dict
+        nodes_conn = cells_dict["triangle"]
         # get lines conn
-        physical_lines_conn = mesh_file.cells_dict["line"]
+        physical_lines_conn = cells_dict["line"]
         # get inlet and vent lines conn
         physical_domains = {}
         physical_lines = {}
         physical_nodes_ids = {}
-        for key in mesh_file.cell_sets_dict:
-            if 'triangle' in mesh_file.cell_sets_dict[key] and 'gmsh' not in key:
-                physical_domains[key] = mesh_file.cell_sets_dict[key]['triangle']
+        for key, cell_set in cell_sets_dict.items():
+            if 'triangle' in cell_set and 'gmsh' not in key:
+                physical_domains[key] = cell_set['triangle']
                 if key not in physical_domain_names:
                     physical_domain_names.append(key)
-            if 'line' in mesh_file.cell_sets_dict[key] and 'gmsh' not in key:
-                physical_lines[key] = mesh_file.cell_sets_dict[key]['line']
+            if 'line' in cell_set and 'gmsh' not in key:
+                physical_lines[key] = cell_set['line']
                 if key not in physical_line_names:
                     physical_line_names.append(key)
         # get node ids for nodes in the physical lines
         for key in physical_lines:
-            physical_nodes_ids[key] = extract_unique_nodes(mesh_file.cells_dict["line"][physical_lines[key]])
+            physical_nodes_ids[key] = extract_unique_nodes(physical_lines_conn[physical_lines[key]])
 
         mesh_data = {
             'all_nodes_coords'      : all_nodes_coords,
@@ -40,9 +40,6 @@ class Writer:
         os.makedirs(destination_path, exist_ok=True)
         points = self._mesh.node_coords  # Node coordinates, assumed to be (N, 3)
         cells = self._mesh.tri_conn_table  # Triangle connectivity (M, 3)
-        cells_list = []
-        for i in range(len(cells)) :
-            cells_list.append(cells[i])
 
         if save_cv_mesh:
             mesh_cv = meshio.Mesh(
@@ -54,7 +51,7 @@ class Writer:
         if _format == "xdmf":
             filename = f"{result_name}.xdmf"
             with meshio.xdmf.TimeSeriesWriter(filename) as writer:
-                writer.write_points_cells(points, [("triangle", cells_list)])
+                writer.write_points_cells(points, [("triangle", cells)])
                 for i in range(solution.n_time_states):
                     time = solution.time[i]
                     point_data = {  "Pressure" : solution.p[i],
@@ -62,7 +59,8 @@ class Writer:
                                     "FreeSurface" : solution.free_surface[i],
                                     "Velocity" : solution.v_nodal[i]
                                  }
-                    cell_data = { "Velocity" : solution.v[i] }
+                    # one array per cell block: a bare (M, 3) array would be concatenated row by row by meshio
+                    cell_data = { "Velocity" : [solution.v[i]] }
                     writer.write_data(time, point_data=point_data, cell_data=cell_data)
             shutil.move(filename, destination_path / filename)
             shutil.move(f"{result_name}.h5", destination_path / f"{result_name}.h5")
@@ -5,6 +5,7 @@
 #  You should have received a copy of the GNU General Public License along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 import numpy as np
+from types import MappingProxyType
 from .materials import PorousMaterial, Resin
 from .rosette import Rosette
 from lizzy.exceptions import ConfigurationError
@@ -12,6 +13,9 @@ from lizzy.exceptions import ConfigurationError
 class MaterialManager:
     """Manager for all material operations.
     """
+    __slots__ = ("_existing_materials", "_assigned_materials", "_assigned_rosettes", "_created_resins", "_assigned_resin",
+                 "_resin_was_assigned", "_default_rosette", "_existing_materials_view", "_assigned_materials_view")
+
     def __init__(self):
         self._existing_materials : dict[str, PorousMaterial] = {}
         self._assigned_materials : dict[str, PorousMaterial] = {}
@@ -19,12 +23,16 @@ class MaterialManager:
         self._created_resins: dict[str, Resin] = {}
         self._assigned_resin: Resin = Resin("default_resin", 0.1)
         self._resin_was_assigned = False
+        self._default_rosette: Rosette = Rosette("default_rosette", (1.0, 0.0, 0.0))
+        # read-only views, created once: they follow the dicts above as materials are created and assigned
+        self._existing_materials_view = MappingProxyType(self._existing_materials)
+        self._assigned_materials_view = MappingProxyType(self._assigned_materials)
     
     @property
-    def assigned_materials(self) -> dict[str, PorousMaterial]:
+    def assigned_materials(self) -> MappingProxyType[str, PorousMaterial]:
         """Dictionary of materials that have been assigned to mesh regions (read-only).
         """
-        return self._assigned_materials
+        return self._assigned_materials_view
     
     @property
     def assigned_resin(self) -> Resin:
@@ -39,28 +47,30 @@ class MaterialManager:
         return self._assigned_rosettes
     
     @property
-    def existing_materials(self) -> dict[str, PorousMaterial]:
+    def existing_materials(self) -> MappingProxyType[str, PorousMaterial]:
         """Dictionary of materials that exist in the model, but may have not been assigned yet (read-only).
         """
-        return self._existing_materials
+        return self._existing_materials_view
 
     def _check_name_uniqueness_in_dict(self, name, dictionary):
         if name in dictionary.keys():
             raise ConfigurationError(f"The name '{name}' has been used more than once. Use unique names.")
     
-    def fetch_material(self, material_selector:str):
+    def fetch_material(self, material_selector:PorousMaterial | str) -> PorousMaterial:
+        if isinstance(material_selector, PorousMaterial):
+            return material_selector
         try:
-            selected_material = self._existing_materials[material_selector]
+            return self._existing_materials[material_selector]
         except KeyError:
-            raise KeyError(f"Inlet '{material_selector}' is not found in existing materials. Check the name, or create the material first using `LizzyModel.create_material`.")
-        return selected_material
+            raise KeyError(f"Material '{material_selector}' is not found in existing materials. Check the name, or create the material first using `LizzyModel.create_material`.")
     
-    def _fetch_resin(self, resin_selector:str):
+    def _fetch_resin(self, resin_selector:Resin | str) -> Resin:
+        if isinstance(resin_selector, Resin):
+            return resin_selector
         try:
-            selected_resin = self._created_resins[resin_selector]
+            return self._created_resins[resin_selector]
         except KeyError:
             raise KeyError(f"Resin '{resin_selector}' was not found. Check the name, or create the resin first using `LizzyModel.create_resin`.")
-        return selected_resin
 
     def _fetch_rosette(self, rosette_selector: str):
         try:
@@ -87,10 +97,10 @@ class MaterialManager:
         self._assigned_rosettes[name] = new_rosette
         return new_rosette
 
-    def assign_material(self, material_selector:str, mesh_tag:str, rosette_selector:str | Rosette = None):
+    def assign_material(self, material_selector:PorousMaterial | str, mesh_tag:str, rosette_selector:str | Rosette = None):
         selected_material : PorousMaterial = self.fetch_material(material_selector)
         if rosette_selector is None:
-            rosette = Rosette((1, 0, 0))
+            rosette = self._default_rosette
         elif isinstance(rosette_selector, str):
             rosette = self._fetch_rosette(rosette_selector)
         else:
@@ -102,7 +112,7 @@ class MaterialManager:
     
 
     
-    def assign_resin(self, resin_selector:str):
+    def assign_resin(self, resin_selector:Resin | str):
         selected_resin : Resin = self._fetch_resin(resin_selector)
         self._assigned_resin = selected_resin
         self._resin_was_assigned = True
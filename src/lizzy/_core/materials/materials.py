@@ -21,6 +21,8 @@ class PorousMaterial:
     thickness: float
         Thickness of the material in the out-of-plane direction.
     """
+    __slots__ = ("is_isotropic", "k_diag", "k_princ", "porosity", "thickness", "name", "assigned")
+
     def __init__(self, name:str, k_vals : tuple[float, float, float], porosity:float, thickness:float):
         if any(k <= 0 for k in k_vals):
             raise ValueError(f"Material '{name}': all permeability values must be positive, got {k_vals}.")
@@ -29,7 +31,8 @@ class PorousMaterial:
         if thickness <= 0:
             raise ValueError(f"Material '{name}': thickness must be positive, got {thickness}.")
         self.is_isotropic = np.allclose([k_vals[0], k_vals[1], k_vals[2]], k_vals[0], atol=1e-14, rtol=0)
-        self.k_princ = np.diag(k_vals)
+        self.k_diag = np.array(k_vals, dtype=np.float64)
+        self.k_princ = np.diag(self.k_diag)
         self.porosity = porosity
         self.thickness = thickness
         self.name = name
@@ -16,15 +16,32 @@ class Rosette:
     p1 : tuple[float, float, float]
         The vector defining the first axis of the rosette (k1 direction).
     """
+    __slots__ = ("name", "u")
+
     def __init__(self, name:str, u=(1.0,0,0)):
         self.name = name
-        self.u = np.array(u)
+        self.u = np.array(u, dtype=np.float64)
 
-    #TODO: this needs reviewing
     def project_along_normal(self, normal):
-        u_normal = np.dot(self.u, normal) * normal
-        u_project = self.u - u_normal
-        u_project = u_project / np.linalg.norm(u_project)
-        v_project = np.cross(u_project, normal)
-        v_project = v_project / np.linalg.norm(v_project)
-        return u_project, v_project, normal
+        # single-element case of project_along_normals, so both share the same kernel
+        u_project, v_project, _ = self.project_along_normals(np.asarray(normal, dtype=np.float64).reshape(1, 3))
+        return u_project[0], v_project[0], normal
+
+    def project_along_normals(self, normals:np.ndarray):
+        """Batched version of :meth:`project_along_normal`, projecting the rosette on many elements at once.
+
+        Parameters
+        ----------
+        normals : np.ndarray
+            Unit normals of the elements, shape (M, 3).
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            The projected u, v and normal directions, each of shape (M, 3).
+        """
+        u_project = self.u - np.einsum('mi,i->m', normals, self.u)[:, None] * normals
+        u_project /= np.sqrt(np.einsum('mi,mi->m', u_project, u_project))[:, None]
+        v_project = np.cross(u_project, normals)
+        v_project /= np.sqrt(np.einsum('mi,mi->m', v_project, v_project))[:, None]
+        return u_project, v_project, normals
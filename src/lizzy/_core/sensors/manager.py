@@ -23,6 +23,8 @@ class SensorManager:
         self.sensors : list[Sensor] = []
         self.sensors_dict = {}
         self.sensor_trigger_states = []
+        self._child_idxs = np.empty(0, dtype=np.intp)
+        self._arrived = np.zeros(0, dtype=bool)
 
     def add_sensor(self, x:float, y:float, z:float):
         """Creates a new :class:`~lizzy.sensors.sensmanager.Sensor` at the specified location and registers it in the sensor manager.
@@ -48,23 +50,31 @@ class SensorManager:
         if len(self.sensors) > 0:
             all_node_coords = mesh.node_coords
             for sensor in self.sensors:
-                distances = []
-                for node_coords in all_node_coords:
-                    distances.append(np.linalg.norm(sensor.position - node_coords))
-                id_closest_node = np.argmin(np.array(distances))
+                # squared distances to all nodes at once: same closest node as comparing the norms
+                offsets = all_node_coords - sensor.position
+                id_closest_node = np.argmin(np.einsum('ij,ij->i', offsets, offsets))
                 sensor.child_node = mesh.nodes[id_closest_node]
-            self.sensor_trigger_states = np.array([False for s in self.sensors])
+            # node idx of every sensor, to gather all readings with one fancy-index per field
+            self._child_idxs = np.fromiter((sensor.child_node.idx for sensor in self.sensors), dtype=np.intp, count=len(self.sensors))
+            self.sensor_trigger_states = np.zeros(len(self.sensors), dtype=bool)
+            self._arrived = np.zeros(len(self.sensors), dtype=bool)
+
+    def _update_resin_arrivals(self, f_vals):
+        # flags the sensors reached by the resin since the last update: once arrived, a sensor stays arrived
+        for i in np.flatnonzero((f_vals >= 0.5) & ~self._arrived):
+            self.sensors[i].resin_arrived = True
+            self._arrived[i] = True
     
     def probe_current_solution(self, p_array, v_array, f_array, current_time):
         """This method updates the existing sensors with the current solution values. This method is called automatically by the solver (not meant for user)."""
         if len(self.sensors) > 0:
-            for sensor in self.sensors:
-                sensor._tvals.append(current_time)
-                sensor._pvals.append(p_array[sensor.child_node.idx])
-                sensor._fvals.append(f_array[sensor.child_node.idx])
-                sensor._vvals.append(v_array[sensor.child_node.idx])
-                if sensor.fill_factor >= 0.5:
-                    sensor.resin_arrived = True
+            child_idxs = self._child_idxs
+            p_vals = p_array[child_idxs]
+            f_vals = f_array[child_idxs]
+            v_vals = v_array[child_idxs]
+            for i, sensor in enumerate(self.sensors):
+                sensor._record(current_time, p_vals[i], f_vals[i], v_vals[i])
+            self._update_resin_arrivals(f_vals)
 
     def reset_sensors(self):
         """Resets all sensors to their initial state.
@@ -72,21 +82,18 @@ class SensorManager:
         if len(self.sensors) > 0:
             for sensor in self.sensors:
                 sensor._reset()
-        self.sensor_trigger_states = np.array([False for s in self.sensors])
+        self.sensor_trigger_states = np.zeros(len(self.sensors), dtype=bool)
+        self._arrived = np.zeros(len(self.sensors), dtype=bool)
 
     def check_for_new_sensor_triggered(self, fill_factor_array) -> bool:
         """Runs through all sensors and updates their :attr:`~lizzy.sensors.sensmanager.Sensor.resin_arrived` attribute based on the current fill factor. Then checks if any new sensor has been triggered compared to the previously recorded state. If so, returns True. This method is called automatically by the solver if needed (not meant for user).
         """
-        triggered = False
-        for sensor in self.sensors:
-            if fill_factor_array[sensor.child_node.idx] >= 0.5:
-                sensor.resin_arrived = True
-        current_trigger_states = np.array([sensor.resin_arrived for sensor in self.sensors])
-        diff = current_trigger_states != self.sensor_trigger_states
-        if np.any(diff):
-            self.sensor_trigger_states = current_trigger_states
-            triggered = True
-        return triggered
+        self._update_resin_arrivals(fill_factor_array[self._child_idxs])
+        if np.any(self._arrived != self.sensor_trigger_states):
+            # rebind rather than write in place: states returned to callers earlier must not change
+            self.sensor_trigger_states = self._arrived.copy()
+            return True
+        return False
 
     def print_sensor_readings(self):
         """Prints to the console the current values of :attr:`~lizzy.sensors.sensmanager.Sensor.time`, :attr:`~lizzy.sensors.sensmanager.Sensor.pressure`, :attr:`~lizzy.sensors.sensmanager.Sensor.fill_factor` and :attr:`~lizzy.sensors.sensmanager.Sensor.velocity` of each sensor.
@@ -11,6 +11,8 @@ if TYPE_CHECKING:
 
 import numpy as np
 
+_INITIAL_HISTORY_CAPACITY = 1024
+
 class Sensor:
     """This class represents a virtual sensor in the model.
 
@@ -23,6 +25,8 @@ class Sensor:
     z : float
         z coordinate of the sensor.
     """
+    __slots__ = ("_idx", "_coords", "_pvals", "_vvals", "_fvals", "_tvals", "_cursor", "resin_arrived", "child_node")
+
     def __init__(self, x:float, y:float, z:float):
         self._idx = 0
         self._coords = np.array((x, y, z))
@@ -30,6 +34,7 @@ class Sensor:
         self._vvals = None   # velocity
         self._fvals = None   # fill factor
         self._tvals = None   # time
+        self._cursor = 0     # number of recorded readings
         self.resin_arrived = False
 
         # temporary quick implementation node-based
@@ -38,12 +43,36 @@ class Sensor:
     def _reset(self):
         """Resets all solution values in the sensor (pressure, velocity, fill factor and time). Maintains the sensor in place and active at the same location. This method is called automatically when a new simulation is initialised.
         """
-        self._pvals = []
-        self._vvals = []
-        self._fvals = []
-        self._tvals = []
+        capacity = _INITIAL_HISTORY_CAPACITY
+        self._pvals = np.empty(capacity)
+        self._vvals = np.empty((capacity, 3))
+        self._fvals = np.empty(capacity)
+        self._tvals = np.empty(capacity)
+        self._cursor = 0
         self.resin_arrived = False
 
+    def _grow(self):
+        """Doubles the capacity of the reading histories, keeping the recorded values.
+        """
+        capacity = 2 * len(self._tvals)
+        for name in ("_pvals", "_vvals", "_fvals", "_tvals"):
+            old = getattr(self, name)
+            new = np.empty((capacity,) + old.shape[1:])
+            new[:self._cursor] = old[:self._cursor]
+            setattr(self, name, new)
+
+    def _record(self, time:float, pressure:float, fill_factor:float, velocity:np.ndarray):
+        """Appends one set of readings to the sensor histories. Called by the sensor manager at each probe (not meant for user).
+        """
+        i = self._cursor
+        if i == len(self._tvals):
+            self._grow()
+        self._tvals[i] = time
+        self._pvals[i] = pressure
+        self._fvals[i] = fill_factor
+        self._vvals[i] = velocity
+        self._cursor = i + 1
+
     @property
     def idx(self) -> int:
         """The unique index of the sensor.
@@ -60,38 +89,70 @@ class Sensor:
     def pressure(self) -> float:
         """The current value of resin pressure (Pa) at the sensor location. (read-only)
         """
-        return self._pvals[-1]
+        return self._pvals[self._cursor - 1]
 
     @property
     def velocity(self) -> np.ndarray:
         """The current value of resin velocity (m/s) at the sensor location. (read-only)
         """
-        return self._vvals[-1]
+        return self._vvals[self._cursor - 1]
     
     @property
     def fill_factor(self) -> float:
         """The current value of resin fill factor at the sensor location. (read-only)
         """
-        return self._fvals[-1]
+        return self._fvals[self._cursor - 1]
     
     @property
     def time(self) -> float:
         """The current time in the simulation. (read-only)
         """
-        return self._tvals[-1]
+        return self._tvals[self._cursor - 1]
+
+    def _history(self, values:np.ndarray) -> np.ndarray:
+        # read-only view on the recorded part of a history buffer, no copy
+        view = values[:self._cursor]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def pressure_history(self) -> np.ndarray:
+        """All recorded values of resin pressure (Pa) at the sensor location, one per probed time step. (read-only view)
+        """
+        return self._history(self._pvals)
+
+    @property
+    def velocity_history(self) -> np.ndarray:
+        """All recorded values of resin velocity (m/s) at the sensor location, shape (n, 3). (read-only view)
+        """
+        return self._history(self._vvals)
+
+    @property
+    def fill_factor_history(self) -> np.ndarray:
+        """All recorded values of resin fill factor at the sensor location. (read-only view)
+        """
+        return self._history(self._fvals)
+
+    @property
+    def time_history(self) -> np.ndarray:
+        """The simulation times at which the sensor readings were recorded. (read-only view)
+        """
+        return self._history(self._tvals)
     
+    # reading name -> property getter, resolved once instead of matched per call
+    _LATEST_READINGS = {
+        "pressure": pressure.fget,
+        "velocity": velocity.fget,
+        "fill_factor": fill_factor.fget,
+        "time": time.fget,
+    }
+
     def get_latest(self, key:str):
-        match key:
-            case "pressure":
-                return self.pressure
-            case "velocity":
-                return self.velocity
-            case "fill_factor":
-                return self.fill_factor
-            case "time":
-                return self.time
-            case _:
-                raise KeyError(f"Unrecognised sensor reading request: {key}")
+        try:
+            getter = self._LATEST_READINGS[key]
+        except KeyError:
+            raise KeyError(f"Unrecognised sensor reading request: {key}")
+        return getter(self)
 
     def info(self) -> str:
         """Returns basic information about the sensor: its ID, position and the ID of the mesh node it is attached to.
@@ -6,8 +6,8 @@
 
 import numpy as np
 from scipy.linalg import solve
-from scipy.sparse import csr_matrix
-from scipy.sparse.linalg import spsolve
+from scipy.sparse import csr_matrix, csc_matrix
+from scipy.sparse.linalg import spsolve, splu
 
 def solve_pressure_direct_dense(k, f):
     p = solve(k, f, assume_a="positive definite")
@@ -16,4 +16,14 @@ def solve_pressure_direct_dense(k, f):
 def solve_pressure_direct_sparse(k:np.ndarray, f:np.ndarray):
     k_sparse = csr_matrix(k)
     p = spsolve(k_sparse, f)
-    return p
\ No newline at end of file
+    return p
+
+def factorize_direct_sparse(k):
+    """
+    Compute a sparse LU factorisation of ``k`` that can be reused for several right-hand sides.
+
+    ``k`` must be symmetric positive definite, as the stiffness matrix and its free blocks are: the factorisation
+    uses a symmetric fill-reducing ordering and keeps the diagonal pivots, which is cheaper than the general LU.
+    """
+    return splu(csc_matrix(k), permc_spec="MMD_AT_PLUS_A", diag_pivot_thresh=0.0,
+                options={"SymmetricMode": True})
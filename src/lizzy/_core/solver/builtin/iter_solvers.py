@@ -5,24 +5,30 @@
 #  You should have received a copy of the GNU General Public License along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 import numpy as np
+from functools import cache
+from importlib.util import find_spec
 from scipy.sparse import csr_matrix
 from scipy.sparse.linalg import cg, bicgstab, gmres
 import warnings
 
-# Optional imports with availability checks
-try:
+# Optional backends are only located here and imported on first use: importing petsc4py initialises
+# PETSc (and MPI), which would otherwise be paid by every `import lizzy`
+PYAMG_AVAILABLE = find_spec("pyamg") is not None
+PETSC_AVAILABLE = find_spec("petsc4py") is not None
+
+@cache
+def _import_pyamg():
     import pyamg
-    PYAMG_AVAILABLE = True
-except ImportError:
-    PYAMG_AVAILABLE = False
+    return pyamg
 
-try:
+@cache
+def _import_petsc():
     import petsc4py
     petsc4py.init()
     from petsc4py import PETSc
-    PETSC_AVAILABLE = True
-except ImportError:
-    PETSC_AVAILABLE = False
+    return PETSc
+
+PETSC_OPTIONS_PREFIX = "lizzy_"
 
 
 def solve_pressure_cg(k: np.ndarray, f: np.ndarray, tol: float = 1e-8, max_iter: int = 1000):
@@ -166,6 +172,7 @@ def solve_pressure_pyamg(k: np.ndarray, f: np.ndarray, tol: float = 1e-8, max_it
         k_sparse = k
     
     # Create AMG hierarchy
+    pyamg = _import_pyamg()
     ml = pyamg.smoothed_aggregation_solver(k_sparse)
     
     # Solve using AMG with residual tracking
@@ -179,8 +186,35 @@ def solve_pressure_pyamg(k: np.ndarray, f: np.ndarray, tol: float = 1e-8, max_it
     return p
 
 
+def _create_petsc_ksp(A, tol, max_iter, ksp_type, pc_type, petsc_options):
+    """Creates the PETSc KSP solving with operator ``A``, configured with the given settings and extra options database entries."""
+    PETSc = _import_petsc()
+    ksp = PETSc.KSP().create()
+    ksp.setOperators(A)
+    
+    # Set up preconditioner
+    pc = ksp.getPC()
+    pc.setType(pc_type)
+    
+    # Set solver parameters
+    ksp.setTolerances(rtol=tol, max_it=max_iter)
+    ksp.setType(ksp_type)
+
+    # Apply any extra options on top of the settings above. A private prefix keeps them out of the global options database
+    if petsc_options:
+        options = PETSc.Options(PETSC_OPTIONS_PREFIX)
+        for key, value in petsc_options.items():
+            options[key] = value
+        ksp.setOptionsPrefix(PETSC_OPTIONS_PREFIX)
+        ksp.setFromOptions()
+        for key in petsc_options:
+            options.delValue(key)
+    return ksp
+
+
 def solve_pressure_petsc(k: np.ndarray, f: np.ndarray, tol: float = 1e-8, max_iter: int = 1000,
-                        ksp_type: str = 'cg', pc_type: str = 'gamg', verbose: bool = False):
+                        ksp_type: str = 'cg', pc_type: str = 'gamg', verbose: bool = False,
+                        petsc_options: dict = None):
     """
     Solve pressure system using PETSc solvers with AMG preconditioning.
     
@@ -200,6 +234,9 @@ def solve_pressure_petsc(k: np.ndarray, f: np.ndarray, tol: float = 1e-8, max_it
         Preconditioner type ('gamg', 'hypre', 'ilu', etc.)
     verbose : bool
         Whether to print convergence information
+    petsc_options : dict, optional
+        Additional PETSc options database entries, without the leading dash
+        (e.g. {'pc_hypre_type': 'boomeramg', 'ksp_gmres_restart': 30}).
         
     Returns
     -------
@@ -215,22 +252,13 @@ def solve_pressure_petsc(k: np.ndarray, f: np.ndarray, tol: float = 1e-8, max_it
         k_sparse = k
     
     # Convert to PETSc format
+    PETSc = _import_petsc()
     A = PETSc.Mat().createAIJ(size=k_sparse.shape, 
                               csr=(k_sparse.indptr, k_sparse.indices, k_sparse.data))
     b = PETSc.Vec().createWithArray(f)
     x = PETSc.Vec().createWithArray(np.zeros_like(f))
     
-    # Set up the KSP solver
-    ksp = PETSc.KSP().create()
-    ksp.setOperators(A)
-    
-    # Set up preconditioner
-    pc = ksp.getPC()
-    pc.setType(pc_type)
-    
-    # Set solver parameters
-    ksp.setTolerances(rtol=tol, max_it=max_iter)
-    ksp.setType(ksp_type)
+    ksp = _create_petsc_ksp(A, tol, max_iter, ksp_type, pc_type, petsc_options)
     
     # Solve the system
     ksp.solve(b, x)
@@ -5,7 +5,7 @@
 #  You should have received a copy of the GNU General Public License along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 import numpy as np
-from scipy.sparse import lil_matrix
+from scipy.sparse import coo_matrix
 
 def Assembly(mesh, mu, sparse=True):
     """
@@ -14,7 +14,7 @@ def Assembly(mesh, mu, sparse=True):
     Parameters
     ----------
     mesh : Mesh
-        The mesh object containing nodes and triangles
+        The mesh object containing nodes and triangles. Element properties must have been gathered with :meth:`Mesh.gather_element_properties`.
     mu : float
         Fluid viscosity
     sparse : bool, optional
@@ -28,22 +28,24 @@ def Assembly(mesh, mu, sparse=True):
     f : numpy array
         Global force vector
     """
-    if sparse:
-        K_tri = lil_matrix((len(mesh.nodes), len(mesh.nodes)))
-    else:
-        K_tri = np.zeros((len(mesh.nodes), len(mesh.nodes)))
-    
-    f = np.zeros((len(mesh.nodes),))
+    n_nodes = len(mesh.nodes)
+    grad_N = np.array([tri.grad_N for tri in mesh.triangles])
+    areas = np.array([tri.A for tri in mesh.triangles])
+    conn = mesh.tri_conn_table
 
-    for tri in mesh.triangles:
-        k_el = tri.grad_N.T @ tri.k @ tri.grad_N * tri.A * tri.h / mu
-        for i in range(3):
-            for j in range(3):
-                K_tri[tri.node_ids[i], tri.node_ids[j]] += k_el[i, j]
-    
+    # grad_N.T @ k @ grad_N * A * h / mu for every element at once
+    k_el = np.einsum('mji,mjk,mkl->mil', grad_N, mesh.k_elem, grad_N)
+    k_el *= (areas * mesh.thickness_elem / mu)[:, None, None]
+
+    # COO triplets: duplicate entries of shared nodes are summed on conversion
+    rows = np.repeat(conn, 3, axis=1).ravel()
+    cols = np.tile(conn, (1, 3)).ravel()
+    K_tri = coo_matrix((k_el.ravel(), (rows, cols)), shape=(n_nodes, n_nodes))
     if sparse:
         K_tri = K_tri.tocsr()  # Convert to CSR for efficient arithmetic operations
+    else:
+        K_tri = K_tri.toarray()
+    
+    f = np.zeros((n_nodes,))
                 
     return K_tri, f
-
-
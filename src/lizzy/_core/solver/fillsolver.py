@@ -10,43 +10,64 @@ import numpy as np
 class FillSolver:
     def __init__(self):
         self.all_fluxes_per_second = None
-        self.map_cv_id_to_support_triangle_ids = {}
-        self.map_cv_id_to_flux_terms = {}
+        self.fill_rates = None
+        # support triangles and flux terms of all CVs, concatenated in CV order (CSR layout)
+        self.support_tri_idxs_flat : np.ndarray = None
+        self.support_offsets : np.ndarray = None
+        self.flux_terms_flat : np.ndarray = None
+        # neighbour CVs of all CVs (CSR layout), with the CV each entry belongs to
+        self.neighbour_idxs_flat : np.ndarray = None
+        self.neighbour_rows : np.ndarray = None
 
-    def find_free_surface_cvs(self, fill_factor_array : np.ndarray, cv_support_cvs_array):
+    def find_free_surface_cvs(self, fill_factor_array : np.ndarray):
         """
-        Finds the control volumes that are on the flow front. These cvs have a fill factor < 1.
+        Finds the control volumes that are on the flow front. These cvs have a fill factor < 1 and at least one filled neighbour.
         """
         candidate_mask = fill_factor_array < 1
-        candidate_indices = np.nonzero(candidate_mask)[0]
-        free_surface_array = np.zeros_like(fill_factor_array, dtype=int)
-        neighbor_filled = np.array([np.any(fill_factor_array[cv_support_cvs_array[i]] >= 1) for i in candidate_indices])
-        active_cv_ids = candidate_indices[neighbor_filled]
+        # mark every CV that has a filled neighbour, in one pass over the adjacency
+        neighbor_filled = np.zeros(len(fill_factor_array), dtype=bool)
+        neighbor_filled[self.neighbour_rows[fill_factor_array[self.neighbour_idxs_flat] >= 1]] = True
+        active_cv_ids = np.flatnonzero(candidate_mask & neighbor_filled)
+        return active_cv_ids
+
+    def build_free_surface_array(self, active_cv_ids, n_cvs):
+        """
+        Flags (1) the flow front CVs in an array over all CVs. Only needed for output, so built only when a time step is saved.
+        """
+        free_surface_array = np.zeros(n_cvs, dtype=int)
         free_surface_array[active_cv_ids] = 1
-        return active_cv_ids, free_surface_array
+        return free_surface_array
 
-    def calculate_time_step(self, active_cv_ids, fill_factor_array, cv_volumes_array, v_array):
+    def calculate_time_step(self, active_cv_ids, fill_factor_array, inv_cv_volumes_array, v_array):
         # calculate fluxes/s per each CV
-        self.all_fluxes_per_second = np.array([self.CalculateVolFluxes(v_array, cv_id) for cv_id in active_cv_ids])
+        self.all_fluxes_per_second = self.calculate_vol_fluxes(v_array, active_cv_ids)
+        # fill factor rate of each CV, reused by fill_current_time_step
+        self.fill_rates = self.all_fluxes_per_second * inv_cv_volumes_array[active_cv_ids]
 
         # calculate time step to fill one:
-        positive = self.all_fluxes_per_second > 0
+        positive = self.fill_rates > 0
         dt = np.min(
-            (1.0 - fill_factor_array[active_cv_ids[positive]]) * cv_volumes_array[active_cv_ids[positive]] / self.all_fluxes_per_second[positive]
+            (1.0 - fill_factor_array[active_cv_ids[positive]]) / self.fill_rates[positive]
         )
-        return dt
+        # return a builtin float: the time bookkeeping downstream is scalar arithmetic
+        return float(dt)
 
-    def fill_current_time_step(self, active_cv_ids, fill_factor_array, cv_volumes_array, dt, fill_tolerance):
+    def fill_current_time_step(self, active_cv_ids, fill_factor_array, dt, fill_tolerance):
         fill_factor_array[active_cv_ids] = np.minimum(
-            fill_factor_array[active_cv_ids] + self.all_fluxes_per_second * dt / cv_volumes_array[active_cv_ids],
+            fill_factor_array[active_cv_ids] + self.fill_rates * dt,
             1.0
         )
         fill_factor_array[fill_factor_array >= (1 - fill_tolerance)] = 1.0
         return fill_factor_array
 
-    def CalculateVolFluxes(self, v_array, cv_id):
-        ids = self.map_cv_id_to_support_triangle_ids[cv_id] # retrieve from dictionary
-        flux_terms_local = self.map_cv_id_to_flux_terms[cv_id] # retrieve from dictionary
-        v_array_local = v_array[ids]
-        cv_flux_per_s = np.sum(np.einsum('ij,ij->i', v_array_local, flux_terms_local))
-        return cv_flux_per_s
\ No newline at end of file
+    def calculate_vol_fluxes(self, v_array, cv_ids):
+        """
+        Volumetric flux per second entering each of the CVs in cv_ids: the sum over the support triangles of each CV of the element velocity dotted with the flux term.
+        """
+        starts = self.support_offsets[cv_ids]
+        counts = self.support_offsets[cv_ids + 1] - starts
+        # positions in the flat arrays of the support triangles of every requested CV, CV after CV
+        segment_starts = np.cumsum(counts) - counts
+        entries = np.arange(counts.sum()) + np.repeat(starts - segment_starts, counts)
+        fluxes = np.einsum('ij,ij->i', v_array[self.support_tri_idxs_flat[entries]], self.flux_terms_flat[entries])
+        return np.add.reduceat(fluxes, segment_starts)
\ No newline at end of file
@@ -15,7 +15,7 @@ if TYPE_CHECKING:
     from lizzy._core.datatypes import SimulationParameters
 
 import numpy as np
-from lizzy._core.solver import *
+from . import fem as fe
 from lizzy.exceptions import ConfigurationError
 from .timestep_manager import TimeStepManager
 from .vsolvers import VelocitySolver
@@ -45,31 +45,39 @@ class Preprocessor:
 
     # 3. setup control volumes
     def setup_cvs(self):
+        # areas and volumes depend on the assigned element properties: computed for all CVs in one pass
+        self.mesh.compute_cv_areas_and_volumes()
         cvs = self.mesh.CVs
         n_cvs = len(cvs)
         node_idx_to_flux_ndarray: list[np.ndarray] = [None]*n_cvs
         for i in range(n_cvs):
-            cvs[i].calculate_area_and_volume()
             node_idx_to_flux_ndarray[i] = cvs[i].compute_flux_terms()
         self.mesh.mesh_view.node_idx_to_flux_ndarray = node_idx_to_flux_ndarray
 
     # 4. assign data to fill solver
     def assign_fill_solver_maps(self):
-        self.fill_solver.map_cv_id_to_support_triangle_ids = self.mesh.mesh_view.node_idx_to_tri_idxs
-        self.fill_solver.map_cv_id_to_flux_terms = self.mesh.mesh_view.node_idx_to_flux_ndarray
+        mesh_view = self.mesh.mesh_view
+        self.fill_solver.support_tri_idxs_flat = mesh_view.node_idx_to_tri_idxs_flat
+        self.fill_solver.support_offsets = mesh_view.node_idx_to_tri_idxs_offsets
+        self.fill_solver.flux_terms_flat = np.concatenate(mesh_view.node_idx_to_flux_ndarray)
+        neighbour_offsets = mesh_view.node_idx_to_node_idxs_offsets
+        self.fill_solver.neighbour_idxs_flat = mesh_view.node_idx_to_node_idxs_flat
+        self.fill_solver.neighbour_rows = np.repeat(np.arange(mesh_view.n_nodes), np.diff(neighbour_offsets))
     
     # 5. assemble global stiffness matrix (singular)
     def assemble_global_stiffnes_matrix(self):
         mu = self.material_manager.assigned_resin.mu
         K_sing, f_orig = fe.Assembly(self.mesh, mu, sparse=True)
-        return K_sing, f_orig
+        # CSC keeps the column slices taken by PressureSolver.solve_with_mask cheap
+        return K_sing.tocsc(), f_orig
 
     def run_preproc_sequence(self):
         print("Preprocessing...")
+        self.mesh.gather_element_properties()
         self.setup_cvs()
         self.assign_fill_solver_maps()
         K_sing, f_orig = self.assemble_global_stiffnes_matrix()
-        self.vsolver.precalculate_darcy_operator(self.mesh.triangles, self.mesh.tri_conn_table)
+        self.vsolver.precalculate_darcy_operator(self.mesh.triangles, self.mesh.k_elem, self.mesh.tri_conn_table)
         return K_sing, f_orig
     
     
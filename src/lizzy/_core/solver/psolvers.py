@@ -5,10 +5,10 @@
 #  You should have received a copy of the GNU General Public License along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 import numpy as np
+from collections import OrderedDict
 from enum import Enum, auto
-from .builtin.direct_solvers import solve_pressure_direct_dense, solve_pressure_direct_sparse
+from .builtin.direct_solvers import solve_pressure_direct_dense, solve_pressure_direct_sparse, factorize_direct_sparse
 from .builtin.iter_solvers import solve_pressure_petsc
-from scipy.sparse import csr_matrix, issparse
 
 class SolverType(Enum):
     """
@@ -27,7 +27,77 @@ class SolverType(Enum):
     DIRECT_SPARSE = auto()
     ITERATIVE_PETSC = auto()
 
+
+def _solve_direct_dense(k, f, tol, max_iter, verbose, **solver_kwargs):
+    return solve_pressure_direct_dense(k, f)
+
+def _solve_direct_sparse(k, f, tol, max_iter, verbose, **solver_kwargs):
+    return solve_pressure_direct_sparse(k, f)
+
+def _solve_petsc(k, f, tol, max_iter, verbose, **solver_kwargs):
+    # Extract PETSc specific parameters
+    ksp_type = solver_kwargs.get('ksp_type', 'cg')
+    pc_type = solver_kwargs.get('pc_type', 'gamg')
+    # Any other keyword is forwarded to the PETSc options database
+    petsc_options = {key: value for key, value in solver_kwargs.items() if key not in ('ksp_type', 'pc_type')}
+    return solve_pressure_petsc(k, f, tol=tol, max_iter=max_iter,
+                                ksp_type=ksp_type, pc_type=pc_type, verbose=verbose,
+                                petsc_options=petsc_options)
+
+# maps each SolverType to the function solving the full system with it
+_SOLVERS = {
+    SolverType.DIRECT_DENSE: _solve_direct_dense,
+    SolverType.DIRECT_SPARSE: _solve_direct_sparse,
+    SolverType.ITERATIVE_PETSC: _solve_petsc,
+}
+
+class FactorizationCache:
+    """
+    Sparse LU factorisations of the reduced systems solved with DIRECT_SPARSE, keyed by the free DOFs and kept in least-recently-used order. Each solver owns its cache, so models living in the same process never share or evict each other's factorisations. The filled region only grows during a run, so only the latest factorisation is ever reused (e.g. when a step is cut short by a write-out or the end of a time interval): older ones are dead weight and are not kept by default.
+
+    Parameters
+    ----------
+    max_size : int
+        Maximum number of factorisations kept. Default is 1.
+    """
+    def __init__(self, max_size:int = 1):
+        self.max_size = max_size
+        self._entries : OrderedDict = OrderedDict()
+        self._matrix = None  # all entries belong to this matrix
+
+    def clear(self):
+        """
+        Drop the cached factorisations. Must be called whenever the global stiffness matrix is rebuilt.
+        """
+        self._entries.clear()
+        self._matrix = None
+
+    def factorize_free_block(self, k_original, free_dofs):
+        """
+        Return the LU factorisation of the free block of ``k_original``, reusing a cached one if the same set of free DOFs was solved recently.
+        """
+        if self._matrix is not k_original:
+            self.clear()
+            self._matrix = k_original
+        entries = self._entries
+        key = free_dofs.tobytes()
+        lu = entries.get(key)
+        if lu is not None:
+            entries.move_to_end(key)
+            return lu
+        lu = factorize_direct_sparse(PressureSolver._extract_free_block(k_original, free_dofs))
+        entries[key] = lu
+        if len(entries) > self.max_size:
+            entries.popitem(last=False)
+        return lu
+
+
 class PressureSolver:
+    @staticmethod
+    def _extract_free_block(k_original, free_dofs):
+        # column slice then row slice, both O(nnz) on CSC
+        return k_original[:, free_dofs][free_dofs, :]
+
     @staticmethod
     def solve(k:np.ndarray, f:np.ndarray, method:SolverType, 
               tol:float = 1e-8, max_iter:int = 1000, verbose:bool = False, **solver_kwargs):
@@ -51,24 +121,16 @@ class PressureSolver:
         **solver_kwargs
             Additional keyword arguments passed to specific solvers.
         """
-        match method:
-            case SolverType.DIRECT_DENSE:
-                p = solve_pressure_direct_dense(k, f)
-            case SolverType.DIRECT_SPARSE:
-                p = solve_pressure_direct_sparse(k, f)
-            case SolverType.ITERATIVE_PETSC:
-                # Extract PETSc specific parameters
-                ksp_type = solver_kwargs.get('ksp_type', 'cg')
-                pc_type = solver_kwargs.get('pc_type', 'gamg')
-                p = solve_pressure_petsc(k, f, tol=tol, max_iter=max_iter,
-                                       ksp_type=ksp_type, pc_type=pc_type, verbose=verbose)
-            case _:
-                raise ValueError(f"Unknown solver type: {method}")
-        return p
+        try:
+            solve_system = _SOLVERS[method]
+        except KeyError:
+            raise ValueError(f"Unknown solver type: {method}")
+        return solve_system(k, f, tol, max_iter, verbose, **solver_kwargs)
 
     @staticmethod
     def solve_with_mask(k_original, f_original, bcs, method:SolverType = SolverType.DIRECT_SPARSE,
-                       tol:float = 1e-8, max_iter:int = 1000, verbose:bool = False, **solver_kwargs):
+                       tol:float = 1e-8, max_iter:int = 1000, verbose:bool = False,
+                       lu_cache:FactorizationCache = None, **solver_kwargs):
         """
         Optimized solver that extracts and solves only the free DOFs (submatrix approach).
         
@@ -80,12 +142,12 @@ class PressureSolver:
         
         Parameters
         ----------
-        k_original : np.ndarray or sparse matrix
-            Original (unmodified) stiffness matrix
+        k_original : scipy.sparse.csc_matrix
+            Original (unmodified) stiffness matrix, as assembled by the preprocessor
         f_original : np.ndarray
             Original (unmodified) force vector
         bcs : SolverBCs
-            Boundary conditions object containing dirichlet_idx, dirichlet_vals, and p0_idx
+            Boundary conditions object containing dirichlet_idx, dirichlet_vals, and p0_idx. If its dirichlet_lift is set, it is used as the rhs contribution of the Dirichlet values instead of recomputing it
         method : SolverType
             The solver type to use for the reduced system
         tol : float
@@ -94,6 +156,8 @@ class PressureSolver:
             Maximum iterations for iterative solvers
         verbose : bool
             Print solver information
+        lu_cache : FactorizationCache, optional
+            Cache of sparse LU factorisations reused across calls with DIRECT_SPARSE. If None, the free block is factorised at every call
         **solver_kwargs
             Additional solver-specific arguments
             
@@ -102,44 +166,65 @@ class PressureSolver:
         np.ndarray
             Full pressure solution vector with all DOFs
         """
-        # Combine all Dirichlet DOFs (inlet pressures + empty node p=0 conditions)
-        dirichlet_idx = np.concatenate([bcs.dirichlet_idx, bcs.p0_idx])
-        dirichlet_vals = np.concatenate([bcs.dirichlet_vals, np.full(len(bcs.p0_idx), bcs.p0_val)])
+        # Dirichlet DOFs are the inlet pressures plus the empty nodes at p0_val. The two sets are used
+        # as they are, without merging them into combined index/value arrays
+        N = k_original.shape[0]
+        p_full = np.zeros(N)
         
         # Identify free DOFs (unknowns to solve for)
-        N = k_original.shape[0]
-        all_dofs = np.arange(N)
-        free_dofs = np.setdiff1d(all_dofs, dirichlet_idx)
+        free_mask = np.ones(N, dtype=bool)
+        free_mask[bcs.dirichlet_idx] = False
+        free_mask[bcs.p0_idx] = False
+        free_dofs = np.flatnonzero(free_mask)
         
         # If all DOFs are constrained, return the constrained values
         if len(free_dofs) == 0:
-            p_full = np.zeros(N)
-            p_full[dirichlet_idx] = dirichlet_vals
+            p_full[bcs.dirichlet_idx] = bcs.dirichlet_vals
+            p_full[bcs.p0_idx] = bcs.p0_val
             return p_full
         
-        # Extract submatrix for free DOFs only
-        K_free = k_original[np.ix_(free_dofs, free_dofs)]
-        K_constrained = k_original[np.ix_(free_dofs, dirichlet_idx)]
-        
-        # Modify RHS to account for known Dirichlet values
-        if issparse(K_constrained):
-            f_free = f_original[free_dofs] - K_constrained.dot(dirichlet_vals)
-        else:
-            f_free = f_original[free_dofs] - K_constrained @ dirichlet_vals
-        
-        # Convert to dense if using DIRECT_DENSE solver and matrix is sparse
-        if method == SolverType.DIRECT_DENSE and issparse(K_free):
-            K_free = K_free.toarray()
+        # Modify RHS to account for known Dirichlet values. Empty nodes usually sit at p0_val = 0 and
+        # are most of the constrained DOFs: only slice their columns when they actually contribute
+        f_lift = bcs.dirichlet_lift
+        if f_lift is None:
+            f_lift = k_original[:, bcs.dirichlet_idx] @ bcs.dirichlet_vals
+        if bcs.p0_val != 0:
+            f_lift = f_lift + k_original[:, bcs.p0_idx] @ np.full(len(bcs.p0_idx), bcs.p0_val)
+        f_free = f_original[free_dofs] - f_lift[free_dofs]
         
         # Solve the reduced system (much smaller!)
-        p_free = PressureSolver.solve(K_free, f_free, method, tol=tol, 
-                                     max_iter=max_iter, verbose=verbose, **solver_kwargs)
+        try:
+            solve_free_block = _FREE_BLOCK_SOLVERS[method]
+        except KeyError:
+            raise ValueError(f"Unknown solver type: {method}")
+        p_free = solve_free_block(k_original, free_dofs, f_free, lu_cache, tol, max_iter, verbose, **solver_kwargs)
         
         # Reconstruct full solution vector
-        p_full = np.zeros(N)
         p_full[free_dofs] = p_free
-        p_full[dirichlet_idx] = dirichlet_vals
+        p_full[bcs.dirichlet_idx] = bcs.dirichlet_vals
+        p_full[bcs.p0_idx] = bcs.p0_val
         
         return p_full
 
 
+def _solve_free_block_sparse_lu(k_original, free_dofs, f_free, lu_cache, tol, max_iter, verbose, **solver_kwargs):
+    # the factorisation is reused as long as no CV fills or empties
+    if lu_cache is None:
+        return solve_pressure_direct_sparse(PressureSolver._extract_free_block(k_original, free_dofs), f_free)
+    lu = lu_cache.factorize_free_block(k_original, free_dofs)
+    return lu.solve(f_free)
+
+def _solve_free_block_dense(k_original, free_dofs, f_free, lu_cache, tol, max_iter, verbose, **solver_kwargs):
+    K_free = PressureSolver._extract_free_block(k_original, free_dofs).toarray()
+    return solve_pressure_direct_dense(K_free, f_free)
+
+def _solve_free_block_petsc(k_original, free_dofs, f_free, lu_cache, tol, max_iter, verbose, **solver_kwargs):
+    K_free = PressureSolver._extract_free_block(k_original, free_dofs)
+    return _solve_petsc(K_free, f_free, tol, max_iter, verbose, **solver_kwargs)
+
+# maps each SolverType to the function solving the reduced (free DOFs) system with it
+_FREE_BLOCK_SOLVERS = {
+    SolverType.DIRECT_DENSE: _solve_free_block_dense,
+    SolverType.DIRECT_SPARSE: _solve_free_block_sparse_lu,
+    SolverType.ITERATIVE_PETSC: _solve_free_block_petsc,
+}
@@ -12,30 +12,39 @@ if TYPE_CHECKING:
     from lizzy._core.gates import GatesManager
     from lizzy._core.cvmesh import Mesh
     from lizzy._core.materials import MaterialManager
+    from lizzy._core.gates.gates import PressureInlet, FlowRateInlet
 
 
+from dataclasses import dataclass, field
 import numpy as np
 import time
-from lizzy._core.solver import *
 from lizzy.exceptions import MeshError, ConfigurationError
 from .timestep_manager import TimeStepManager
 from .vsolvers import VelocitySolver
 from .fillsolver import FillSolver
-from .psolvers import PressureSolver, SolverType
+from .psolvers import PressureSolver, SolverType, FactorizationCache
+from .builtin.iter_solvers import PETSC_AVAILABLE, _import_petsc
 from .preprocessor import Preprocessor
 from lizzy._core.gates.gates import InletType
 
+# progress line refreshed while logging is on, at most once every _PROGRESS_INTERVAL seconds
+_PROGRESS_FMT = "\rFill time: %.2fs, Empty CVs: %4d"
+_PROGRESS_INTERVAL = 0.1
+
+def _log_enabled(log) -> bool:
+    # `log` accepts a bool, or the strings "on"/"off"
+    return log is True or log == "on"
 
-class SolverBCs:
-    __slots__ = ("dirichlet_idx", "dirichlet_vals", "neumann_idx", "neumann_vals", "p0_idx", "p0_val")
 
-    def __init__(self):
-        self.dirichlet_idx = np.empty(0, dtype=np.uint32)
-        self.dirichlet_vals = np.empty(0, dtype=np.float64)
-        self.neumann_idx = np.empty(0, dtype=np.uint32)
-        self.neumann_vals = np.empty(0, dtype=np.float64)
-        self.p0_idx = np.empty(0, dtype=np.uint32)
-        self.p0_val = 0.0
+@dataclass(slots=True)
+class SolverBCs:
+    dirichlet_idx : np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    dirichlet_vals : np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    neumann_idx : np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    neumann_vals : np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    p0_idx : np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    p0_val : float = 0.0
+    dirichlet_lift : np.ndarray = None  # K[:, dirichlet_idx] @ dirichlet_vals, rebuilt with the bcs
 
 class Solver:
     def __init__(self, mesh:Mesh, gates_manager, simulation_parameters, material_manager:MaterialManager, sensor_manager:SensorManager, 
@@ -56,29 +65,40 @@ class Solver:
         self.bcs = SolverBCs()
         self.solver_type = solver_type
         if solver_type == SolverType.ITERATIVE_PETSC:
+            # petsc4py may be installed but fail to import or initialise: import it now rather than mid-solve
             try:
-                import petsc4py
-                petsc4py.init()
-                from petsc4py import PETSc
-            except ImportError:
+                if not PETSC_AVAILABLE:
+                    raise ImportError("petsc4py not found")
+                _import_petsc()
+            except (ImportError, RuntimeError):
                 print("Import Error: PETSc not available. Reverting to DIRECT_SPARSE builtin solver.")
                 self.solver_type = SolverType.DIRECT_SPARSE
         self.solver_tol = solver_tol
         self.solver_max_iter = solver_max_iter
         self.solver_verbose = solver_verbose
         self.solver_kwargs = solver_kwargs
+        self.lu_cache = FactorizationCache()
         self.N_nodes = mesh.mesh_view.n_nodes
         self.K_sing = None
         self.f_orig = None
+        self.mu = None
+        self.f_neumann = None
+        self.pressure_inlet_bcs : list[tuple[PressureInlet, np.ndarray]] = []
+        self.flowrate_inlet_bcs : list[tuple[FlowRateInlet, np.ndarray, np.ndarray]] = []
+        self._bcs_state = None  # gate state the current bcs were built from
         self.current_time = 0
         self.n_empty_cvs = np.inf
         self.next_wo_time = self.simulation_parameters.output_interval
         self.step_end_time = np.inf
         self.step_completed = False
+        self._last_log_time = 0.0
         self.solver_vars = {"fill_factor_array" : np.zeros(self.N_nodes, dtype=float),
                             "free_surface_array" : np.empty(self.N_nodes),
-                            "cv_volumes_array" : np.empty(self.N_nodes),}
-        self.cv_support_cvs_array = self.mesh.mesh_view.node_idx_to_node_idxs # TODO do cleaner
+                            "cv_volumes_array" : np.empty(self.N_nodes),
+                            "inv_cv_volumes_array" : np.empty(self.N_nodes),}
+        # nodal velocities are not computed yet: every time step shares one read-only array of zeros
+        self.v_nodal_zeros = np.zeros((self.N_nodes, 3))
+        self.v_nodal_zeros.flags.writeable = False
 
         self.perform_precalcs()
         self.initialise_new_solution()
@@ -86,7 +106,11 @@ class Solver:
 
     def perform_precalcs(self):
         self.K_sing, self.f_orig = self.preproc.run_preproc_sequence() # TODO: reorder nodes here to reduce bandwidth - then reorder the whole mesh and objects
+        # the resin is fixed once the solver is initialised, and K_sing was assembled with this viscosity
+        self.mu = self.material_manager.assigned_resin.mu
+        self.lu_cache.clear()
         self.vectorize_solver_vars()
+        self.precalculate_inlet_boundaries()
         self.initialise_sensor_manager() # could move into preprocessor as this runs only once
     
     def initialise_sensor_manager(self):
@@ -95,59 +119,72 @@ class Solver:
 
     def vectorize_solver_vars(self):
         # precalculate vectorised version of all variables
-        # TODO this part can go faster
-        cv_volumes_list = []
-        for cv in self.mesh.CVs:
-            cv_volumes_list.append(cv.vol)
-        self.solver_vars["cv_volumes_array"] = np.array(cv_volumes_list, dtype=float)
+        self.solver_vars["cv_volumes_array"] = self.mesh.cv_volumes
+        self.solver_vars["inv_cv_volumes_array"] = 1.0 / self.solver_vars["cv_volumes_array"]
         
 
-    def update_bcs(self):
-        # TODO this is more "update inlet dirichlet bcs" since it only applies pressure (doesn't add empty 0 pressure). It can be faster, but it doesn't run often (only at beginning of time intervals) so it's not critical
-        dirichlet_idxs = []
-        dirichlet_vals = []
-        neumann_idxs_pairs = []
-        neumann_vals_per_idx_pair = []
-        dict_boundary_name_to_inlet_obj = self.gates_manager._assigned_inlets
-        phys_boundary_names_set = self.mesh.mesh_view.phys_boundary_names_set
-        viscosity = self.material_manager.assigned_resin.mu
-        for boundary_name, inlet in dict_boundary_name_to_inlet_obj.items():
-            if boundary_name not in phys_boundary_names_set:
+    def precalculate_inlet_boundaries(self):
+        """
+        Resolves once the mesh entities of each assigned inlet. Inlets cannot be (re)assigned after the solver is initialised, so "update_bcs()" only needs to read the current state and value of each inlet.
+        """
+        mesh_view = self.mesh.mesh_view
+        self.pressure_inlet_bcs = []
+        self.flowrate_inlet_bcs = []
+        for boundary_name, inlet in self.gates_manager.assigned_inlets.items():
+            if boundary_name not in mesh_view.phys_boundary_names_set:
                 raise MeshError(f"Mesh does not contain physical tag: '{boundary_name}'.")
             match inlet.type:
                 case InletType.PRESSURE:
-                    node_idxs = self.mesh.mesh_view.phys_boundary_name_to_node_idxs[boundary_name]
-                    if inlet.is_open:
-                        # TODO: BUG: we will have a problem here if 2 different boundary edges with bcs applied share a common node...
-                        dirichlet_idxs.append(node_idxs)
-                        dirichlet_vals.append(np.full(len(node_idxs), inlet.p_value, dtype=np.float64))
+                    node_idxs = mesh_view.phys_boundary_name_to_node_idxs[boundary_name]
+                    self.pressure_inlet_bcs.append((inlet, node_idxs))
                 case InletType.FLOW_RATE:
-                    boundary_line_idxs = self.mesh.mesh_view.phys_boundary_name_to_boundary_line_idxs[boundary_name]
+                    boundary_line_idxs = mesh_view.phys_boundary_name_to_boundary_line_idxs[boundary_name]
                     boundary_line_objs = [self.mesh.boundary_lines[i] for i in boundary_line_idxs]
-                    tri_objs = [self.mesh.triangles[line.idx] for line in boundary_line_objs]
-                    boundary_line_thicknesses = np.array([tri.h for tri in tri_objs])
+                    tri_idxs = [line.tri_idx for line in boundary_line_objs]
+                    boundary_line_thicknesses = self.mesh.thickness_elem[tri_idxs]
                     boundary_line_lengths = np.array([line.length for line in boundary_line_objs])
                     boundary_flux_areas = boundary_line_thicknesses * boundary_line_lengths
                     total_area = np.sum(boundary_flux_areas)
-                    node_pairs_idxs = self.mesh.mesh_view.boundary_line_idx_to_node_idxs[boundary_line_idxs] # gives 2 node idxs. At this point, node_pair_idxs (n_lines, 2) and line_lengths (n_lines, ) are in the same order - shape: (n_neumann_lines, 2)
-                    neumann_vals_pairs = np.repeat(boundary_flux_areas/2, 2) * (inlet.q_value/total_area)
-                    neumann_vals_pairs = neumann_vals_pairs.reshape(len(node_pairs_idxs), 2)
-                    if inlet.is_open:
-                        neumann_idxs_pairs.append(node_pairs_idxs)
-                        neumann_vals_per_idx_pair.append(neumann_vals_pairs)
+                    node_pairs_idxs = mesh_view.boundary_line_idx_to_node_idxs[boundary_line_idxs] # gives 2 node idxs. At this point, node_pair_idxs (n_lines, 2) and line_lengths (n_lines, ) are in the same order - shape: (n_neumann_lines, 2)
+                    # share of the inlet flow rate going to each node of each line, flattened in the same order as node_pairs_idxs
+                    flux_weights = np.repeat(boundary_flux_areas/2, 2) / total_area
+                    self.flowrate_inlet_bcs.append((inlet, node_pairs_idxs.flatten(), flux_weights))
                     print("Note: Flow rate BC is experimental.")
                 case _:
                     pass
-        # TODO: do this following assertion a little better...
-        try:
-            if len(dirichlet_idxs) > 0:
-                self.bcs.dirichlet_idx = np.concatenate(dirichlet_idxs)
-                self.bcs.dirichlet_vals = np.concatenate(dirichlet_vals)
-            if len(neumann_idxs_pairs) > 0:
-                self.bcs.neumann_idx = np.concatenate(neumann_idxs_pairs).flatten()
-                self.bcs.neumann_vals = np.concatenate(neumann_vals_per_idx_pair).flatten()
-        except ValueError:
+
+    def _read_bcs_state(self) -> tuple:
+        # everything update_bcs reads from the gates: open state and value of each inlet, and the vent pressure
+        vents = self.gates_manager._assigned_vents
+        return (tuple((inlet.is_open, inlet.p_value) for inlet, _ in self.pressure_inlet_bcs),
+                tuple((inlet.is_open, inlet.q_value) for inlet, _, _ in self.flowrate_inlet_bcs),
+                next(iter(vents.values())).vacuum_pressure if len(vents) > 0 else None)
+
+    def update_bcs(self):
+        # TODO this is more "update inlet dirichlet bcs" since it only applies pressure (doesn't add empty 0 pressure).
+        # every solve call starts here: skip the rebuild if no gate changed since the last one
+        bcs_state = self._read_bcs_state()
+        if bcs_state == self._bcs_state:
+            return
+        dirichlet_idxs = []
+        dirichlet_vals = []
+        neumann_idxs = []
+        neumann_vals = []
+        for inlet, node_idxs in self.pressure_inlet_bcs:
+            if inlet.is_open:
+                # TODO: BUG: we will have a problem here if 2 different boundary edges with bcs applied share a common node...
+                dirichlet_idxs.append(node_idxs)
+                dirichlet_vals.append(np.full(len(node_idxs), inlet.p_value, dtype=np.float64))
+        for inlet, node_idxs, flux_weights in self.flowrate_inlet_bcs:
+            if inlet.is_open:
+                neumann_idxs.append(node_idxs)
+                neumann_vals.append(flux_weights * inlet.q_value)
+        if len(dirichlet_idxs) == 0 and len(neumann_idxs) == 0:
             raise ConfigurationError("No inlets are currently open. At least one inlet must be open at all times to allow resin to flow into the part.")
+        self.bcs.dirichlet_idx = np.concatenate(dirichlet_idxs) if dirichlet_idxs else np.empty(0, dtype=np.int64)
+        self.bcs.dirichlet_vals = np.concatenate(dirichlet_vals) if dirichlet_vals else np.empty(0, dtype=np.float64)
+        self.bcs.neumann_idx = np.concatenate(neumann_idxs) if neumann_idxs else np.empty(0, dtype=np.int64)
+        self.bcs.neumann_vals = np.concatenate(neumann_vals) if neumann_vals else np.empty(0, dtype=np.float64)
         
         # assign vacuum vent pressure if vent exists
         if len(self.gates_manager._assigned_vents) > 0:
@@ -156,6 +193,13 @@ class Solver:
         else:
             self.bcs.p0_val = 0.0
 
+        # the Neumann contributions only change with the bcs, so the rhs is built here and reused by every time step
+        self.f_neumann = self.f_orig.copy()
+        np.add.at(self.f_neumann, self.bcs.neumann_idx, self.bcs.neumann_vals)
+        # same for the rhs lift of the inlet pressures, which otherwise slices K at every time step
+        self.bcs.dirichlet_lift = self.K_sing[:, self.bcs.dirichlet_idx] @ self.bcs.dirichlet_vals
+        self._bcs_state = bcs_state
+
     def get_empty_nodes_idx(self, fill_factor):
         """
         Complementary to "update_bcs()", this updates the indices of all nodes with a fill factor < 1.0. These will be uses to assign an internal condition p=0.
@@ -178,10 +222,9 @@ class Solver:
         p_0 = np.full(len(self.mesh.nodes), self.bcs.p0_val, dtype=np.float64)
         fill_factor_0 = np.zeros(len(self.mesh.nodes))
         flow_front_0 = np.zeros(len(self.mesh.nodes))
-        for idx, val in zip(self.bcs.dirichlet_idx, self.bcs.dirichlet_vals):
-            p_0[idx] = val
-            fill_factor_0[idx] = 1
-            flow_front_0[idx] = 1
+        p_0[self.bcs.dirichlet_idx] = self.bcs.dirichlet_vals
+        fill_factor_0[self.bcs.dirichlet_idx] = 1
+        flow_front_0[self.bcs.dirichlet_idx] = 1
         v_0 = np.zeros((len(self.mesh.triangles), 3))
         v_nodal_0 = np.zeros((len(self.mesh.nodes), 3))
         initial_time_step = (time_0, dt_0, p_0, v_0, v_nodal_0, fill_factor_0, flow_front_0)
@@ -196,6 +239,8 @@ class Solver:
         self.next_wo_time = self.simulation_parameters.output_interval
         self.solver_vars["fill_factor_array"] = np.zeros(self.N_nodes)
         self.bcs = SolverBCs()
+        self._bcs_state = None
+        self.lu_cache.clear()
         self.mesh.empty_cvs()
         self.gates_manager.reset_inlets()
         self.update_bcs()
@@ -203,8 +248,8 @@ class Solver:
         p0_idxs = self.get_empty_nodes_idx(self.solver_vars["fill_factor_array"])
         self.n_empty_cvs = len(p0_idxs)
         self.bcs.p0_idx = p0_idxs
-        active_cvs_ids, self.solver_vars["free_surface_array"] = self.fill_solver.find_free_surface_cvs(
-            self.solver_vars["fill_factor_array"], self.cv_support_cvs_array)
+        active_cvs_ids = self.fill_solver.find_free_surface_cvs(self.solver_vars["fill_factor_array"])
+        self.solver_vars["free_surface_array"] = self.fill_solver.build_free_surface_array(active_cvs_ids, self.N_nodes)
         self.time_step_manager.reset()
         initial_time_step = self.generate_initial_time_step()
         self.time_step_manager.save_timestep(*initial_time_step)
@@ -242,33 +287,28 @@ class Solver:
 
     def solve_time_step(self, lightweight=False):
         fill_factor = self.solver_vars["fill_factor_array"]
-        free_surface = self.solver_vars["free_surface_array"]
-        cv_volumes = self.solver_vars["cv_volumes_array"]
-
-        neumann_idxs = self.bcs.neumann_idx
-        neumann_vals = self.bcs.neumann_vals
-        f_neumann = self.f_orig.copy()
-        for i in range(len(neumann_idxs)):
-            f_neumann[neumann_idxs[i]] += neumann_vals[i]
+        inv_cv_volumes = self.solver_vars["inv_cv_volumes_array"]
+        simulation_parameters = self.simulation_parameters
+
         p = PressureSolver.solve_with_mask(
-            self.K_sing, f_neumann, self.bcs, 
+            self.K_sing, self.f_neumann, self.bcs, 
             self.solver_type, tol=self.solver_tol,
             max_iter=self.solver_max_iter, verbose=self.solver_verbose,
-            **self.solver_kwargs)
+            lu_cache=self.lu_cache, **self.solver_kwargs)
 
-        v_array = self.vsolver.calculate_elem_velocities(p, self.material_manager.assigned_resin.mu)
-        v_nodal_array = np.zeros((self.N_nodes, 3))
+        v_array = self.vsolver.calculate_elem_velocities(p, self.mu)
+        v_nodal_array = self.v_nodal_zeros
 
-        active_cvs_ids, free_surface = self.fill_solver.find_free_surface_cvs(fill_factor, self.cv_support_cvs_array)
-        dt = self.fill_solver.calculate_time_step(active_cvs_ids, fill_factor, cv_volumes, v_array)
+        active_cvs_ids = self.fill_solver.find_free_surface_cvs(fill_factor)
+        dt = self.fill_solver.calculate_time_step(active_cvs_ids, fill_factor, inv_cv_volumes, v_array)
         dt, write_out = self.handle_wo_criterion(dt)
 
-        fill_factor = self.fill_solver.fill_current_time_step(active_cvs_ids, fill_factor, cv_volumes, dt, self.simulation_parameters.fill_tolerance)
+        fill_factor = self.fill_solver.fill_current_time_step(active_cvs_ids, fill_factor, dt, simulation_parameters.fill_tolerance)
 
         # Update the filling time
         self.current_time += dt
 
-        if self.simulation_parameters.end_step_when_sensor_triggered:
+        if simulation_parameters.end_step_when_sensor_triggered:
             write_out = self.handle_wo_by_sensor_triggered(write_out, fill_factor)
         # update the empty nodes idxs and count for next step
         p0_idxs = self.get_empty_nodes_idx(fill_factor)
@@ -277,21 +317,36 @@ class Solver:
         # always save and probe the final timestep
         if self.n_empty_cvs == 0:
             write_out = True
+            # the run is complete: release the factorisations rather than keeping them alive on the solver
+            self.lu_cache.clear()
         if write_out:
             if not lightweight:
+                # output-only data: skipped entirely in lightweight mode
+                free_surface = self.fill_solver.build_free_surface_array(active_cvs_ids, self.N_nodes)
+                self.solver_vars["free_surface_array"] = free_surface
                 self.time_step_manager.save_timestep(self.current_time, dt, p, v_array, v_nodal_array, fill_factor, free_surface)
             self._sensor_manager.probe_current_solution(p, v_nodal_array, fill_factor, self.current_time)
 
+    def log_progress(self, force=False):
+        # small meshes run thousands of steps per second: throttle the console writes
+        now = time.perf_counter()
+        if force or now - self._last_log_time >= _PROGRESS_INTERVAL:
+            self._last_log_time = now
+            print(_PROGRESS_FMT % (self.current_time, self.n_empty_cvs), end='')
+
     def solve(self, log="on", lightweight=False):
         solution = None
         solve_time_start = time.time()
         self.step_end_time = np.inf  # reset step end time for full solve
         print("SOLVE STARTED for mesh with {} elements".format(len(self.mesh.triangles)))
         self.update_bcs()
+        log_on = _log_enabled(log)
         while self.n_empty_cvs > 0:
-            self.solve_time_step()
-            if log == "on":
-                print("\rFill time: {:.2f}".format(self.current_time) + "s, Empty CVs: {:4}".format(self.n_empty_cvs), end='')
+            self.solve_time_step(lightweight=lightweight)
+            if log_on:
+                self.log_progress()
+        if log_on:
+            self.log_progress(force=True)
         if not lightweight:
             solution = self.time_step_manager.pack_solution()
         # good night and good luck
@@ -305,12 +360,14 @@ class Solver:
         self.step_completed = False
         self.step_end_time = self.current_time + time_interval
         solve_time_start = time.time()
+        self.update_bcs()
+        log_on = _log_enabled(log)
         while self.step_completed == False and self.n_empty_cvs > 0:
-            self.update_bcs()
             self.solve_time_step(lightweight=lightweight)
-            if log == "on":
-                print("\rFill time: {:.2f}".format(self.current_time) + "s, Empty CVs: {:4}".format(self.n_empty_cvs),
-                      end='')
+            if log_on:
+                self.log_progress()
+        if log_on:
+            self.log_progress(force=True)
         if not lightweight:
             solution = self.time_step_manager.pack_solution()
         solve_time_end = time.time()
@@ -12,12 +12,10 @@ class VelocitySolver:
         self.darcy_operator = any
         self.nodes_conn = any
 
-    def precalculate_darcy_operator(self, triangles, tri_conn_table):
+    def precalculate_darcy_operator(self, triangles, k_elem, tri_conn_table):
         """precalculate vectorised coefficient darcy_operator of shape function gradients for velocity: v = darcy_operator * p"""
-        b_ncol = triangles[0].grad_N.shape[1]
-        self.darcy_operator = np.empty((len(triangles), 3, b_ncol), dtype=float)
-        for i in range(len(triangles)):
-            self.darcy_operator[i] = triangles[i].k.T @ triangles[i].grad_N
+        grad_N = np.array([tri.grad_N for tri in triangles])
+        self.darcy_operator = np.einsum('mji,mjk->mik', k_elem, grad_N) # k.T @ grad_N for every element
         self.nodes_conn = tri_conn_table
 
     def calculate_elem_velocities(self, p, mu):
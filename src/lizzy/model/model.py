@@ -14,7 +14,6 @@ if TYPE_CHECKING:
     from lizzy.datatypes import Solution
 
 from typing import Dict, Literal
-from types import MappingProxyType
 from lizzy._core.io import Reader, Writer
 from lizzy._core.cvmesh import Mesh
 from lizzy._core.gates import GatesManager
@@ -30,6 +29,9 @@ class LizzyModel:
     """
     The main class for defining simulations in Lizzy. This class wraps all subcomponents of the solver and exposes all user-facing APIs. Provides access to methods for reading a mesh, assigning properties, configuring the solver, saving results and more. A script typically begins with the instantiation of a LizzyModel.
     """
+    __slots__ = ("_model_name", "_reader", "_writer", "_simulation_parameters", "_material_manager", "_gates_manager",
+                 "_sensor_manager", "_mesh", "_solver", "_latest_solution", "_lightweight", "_state")
+
     def __init__(self):
         print_logo()
         self._model_name:str = None
@@ -79,13 +81,13 @@ class LizzyModel:
     def assigned_materials(self) -> Dict[str, PorousMaterial]:
         """Dictionary of assigned materials in the model. (read-only)
         """
-        return MappingProxyType(self._material_manager.assigned_materials)
+        return self._material_manager.assigned_materials
 
     @property
     def existing_materials(self) -> Dict[str, PorousMaterial]:
         """Dictionary of existing materials in the model. A material can be existing (after being created with :func:`~LizzyModel.create_material`) but not assigned to any mesh region. (read-only)
         """
-        return MappingProxyType(self._material_manager.existing_materials)
+        return self._material_manager.existing_materials
 
     @property
     def n_empty_cvs(self) -> int:
@@ -566,7 +568,7 @@ class LizzyModel:
         solver_verbose : bool
             Print solver convergence information
         **solver_kwargs
-            Additional solver-specific keyword arguments
+            Additional solver-specific keyword arguments. For ITERATIVE_PETSC, ``ksp_type`` and ``pc_type`` select the Krylov method and preconditioner (default: ``cg`` and ``gamg``); any other keyword is passed to the PETSc options database, e.g. ``pc_hypre_type="boomeramg"``.
 
         Raises
         ------
@@ -595,13 +597,13 @@ class LizzyModel:
         self._mesh.assert_all_elements_have_material()
 
     @postinit_only
-    def solve(self, log="on") -> Solution:
+    def solve(self, log:bool | str = "on") -> Solution:
         """Advance the filling simulation from the current time until the part is filled.
 
         Parameters
         ----------
-        log : str, optional
-            Whether to print the progress of the solution, by default "on"
+        log : bool | str, optional
+            Whether to print the progress of the solution: True/"on" or False/"off", by default "on"
 
         Returns
         -------
@@ -612,15 +614,15 @@ class LizzyModel:
         return self._latest_solution
 
     @postinit_only
-    def solve_time_interval(self, time_interval:float, log="off") -> Solution:
+    def solve_time_interval(self, time_interval:float, log:bool | str = "off") -> Solution:
         """Advance the filling simulation from the current time for the specified time interval.
 
         Parameters
         ----------
         time_interval : float
             The time period to advance the simulation for.
-        log : str, optional
-            Whether to print the progress of the solution, by default "off"
+        log : bool | str, optional
+            Whether to print the progress of the solution: True/"on" or False/"off", by default "off"
 
         Returns
         -------
@@ -0,0 +1,57 @@
+#  Copyright 2025-2026 Simone Bancora, Paris Mulye
+#
+#  This program is free software: you can redistribute it and/or modify it under the terms of the GNU General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later version.
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import lizzy as liz
+import numpy as np
+import pytest
+
+@pytest.fixture()
+def model():
+    model = liz.LizzyModel()
+    model.read_mesh_file("tests/test_meshes/Rect_1M_R1.msh")
+    model.assign_simulation_parameters(output_interval=100)
+    model.create_resin("resin", 0.1)
+    model.assign_resin("resin")
+    model.create_material("test_material", (1E-10, 1E-10, 1E-10), 0.5, 0.005)
+    model.assign_material("test_material", 'domain')
+    return model
+
+def test_flowrate_inlet_uses_thickness_of_boundary_elements(model: liz.LizzyModel):
+    flow_rate = 1E-06
+    elements = model.get_elements()
+    # thickness varying along the inlet edge, so that each boundary line takes the thickness of its own element
+    for tri in elements:
+        tri.h = 0.005 * (1 + 4 * tri.centroid[1])
+    model.create_flowrate_inlet("inlet_left", flow_rate)
+    model.assign_inlet("inlet_left", "left_edge")
+    model.initialise_solver()
+
+    # brute force: inlet lines are the element edges lying on x = 0, each belonging to a single element
+    node_coords = model._mesh.node_coords
+    x_min = node_coords[:, 0].min()
+    expected_load = np.zeros(len(node_coords))
+    line_loads = []
+    for tri in elements:
+        on_edge = [idx for idx in tri.node_ids if np.isclose(node_coords[idx, 0], x_min)]
+        if len(on_edge) == 2:
+            length = np.linalg.norm(node_coords[on_edge[0]] - node_coords[on_edge[1]])
+            line_loads.append((on_edge, length * tri.h))
+    total_area = sum(area for _, area in line_loads)
+    for node_pair, area in line_loads:
+        expected_load[node_pair] += flow_rate * area / 2 / total_area
+
+    solver = model._solver
+    assert np.allclose(solver.f_neumann - solver.f_orig, expected_load, rtol=1e-12, atol=0)
+    assert np.isclose(expected_load.sum(), flow_rate)
+
+def test_closing_all_inlets_mid_run_raises(model: liz.LizzyModel):
+    model.create_pressure_inlet("inlet_left", 1E+05)
+    model.assign_inlet("inlet_left", "left_edge")
+    model.initialise_solver()
+    model.solve_time_interval(100)
+    model.close_inlet("inlet_left")
+    with pytest.raises(liz.ConfigurationError):
+        model.solve_time_interval(100)
@@ -0,0 +1,26 @@
+#  Copyright 2025-2026 Simone Bancora, Paris Mulye
+#
+#  This program is free software: you can redistribute it and/or modify it under the terms of the GNU General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later version.
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import lizzy as liz
+
+def test_node_to_triangle_map_matches_brute_force():
+    model = liz.LizzyModel()
+    # the centre node of the fan is shared by all 12 triangles
+    model.read_mesh_file("tests/test_meshes/Fan_12elem.msh")
+    mesh_view = model._mesh.mesh_view
+    tri_idxs = mesh_view.node_idx_to_tri_idxs_flat
+    offsets = mesh_view.node_idx_to_tri_idxs_offsets
+
+    expected = [[] for _ in range(mesh_view.n_nodes)]
+    for tri_idx, tri in enumerate(model.get_elements()):
+        for node_idx in tri.node_ids:
+            expected[node_idx].append(tri_idx)
+
+    assert max(len(tris) for tris in expected) > 8
+    assert len(offsets) == mesh_view.n_nodes + 1
+    for node_idx, tris in enumerate(expected):
+        assert tri_idxs[offsets[node_idx]:offsets[node_idx + 1]].tolist() == tris
+        assert sorted(mesh_view.node_idx_to_tri_idxs[node_idx]) == tris
@@ -0,0 +1,45 @@
+#  Copyright 2025-2026 Simone Bancora, Paris Mulye
+#
+#  This program is free software: you can redistribute it and/or modify it under the terms of the GNU General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later version.
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+import pytest
+from scipy.sparse import diags
+
+pytest.importorskip("petsc4py")
+
+from lizzy._core.solver.builtin.iter_solvers import _create_petsc_ksp, _import_petsc, solve_pressure_petsc, PETSC_OPTIONS_PREFIX
+
+def laplacian_1d(n):
+    # SPD tridiagonal system with a known solution
+    k = diags([-np.ones(n - 1), 2.0 * np.ones(n) + 1e-3, -np.ones(n - 1)], [-1, 0, 1], format="csr")
+    p_exact = np.linspace(1.0, 2.0, n)
+    return k, k @ p_exact, p_exact
+
+def test_petsc_options_reach_ksp_and_pc():
+    PETSc = _import_petsc()
+    k, _, _ = laplacian_1d(50)
+    A = PETSc.Mat().createAIJ(size=k.shape, csr=(k.indptr, k.indices, k.data))
+    ksp = _create_petsc_ksp(A, 1e-8, 1000, "gmres", "gamg", {"ksp_max_it": 7, "pc_type": "jacobi"})
+    rtol, _, _, max_it = ksp.getTolerances()
+    assert ksp.getType() == "gmres"
+    assert rtol == 1e-8
+    assert max_it == 7
+    assert ksp.getPC().getType() == "jacobi"
+    # the options are removed from the database once applied
+    options = PETSc.Options()
+    assert not options.hasName(PETSC_OPTIONS_PREFIX + "ksp_max_it")
+    assert not options.hasName(PETSC_OPTIONS_PREFIX + "pc_type")
+    ksp.destroy()
+    A.destroy()
+
+def test_petsc_options_change_the_solve():
+    k, f, p_exact = laplacian_1d(200)
+    p = solve_pressure_petsc(k, f, tol=1e-12, max_iter=1000, ksp_type="cg", pc_type="none")
+    assert np.allclose(p, p_exact, rtol=1e-8)
+    # a single iteration allowed through the options database cannot converge
+    p_one_iteration = solve_pressure_petsc(k, f, tol=1e-12, max_iter=1000, ksp_type="cg", pc_type="none",
+                                           petsc_options={"ksp_max_it": 1})
+    assert not np.allclose(p_one_iteration, p_exact, rtol=1e-3)
@@ -0,0 +1,65 @@
+#  Copyright 2025-2026 Simone Bancora, Paris Mulye
+#
+#  This program is free software: you can redistribute it and/or modify it under the terms of the GNU General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later version.
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import lizzy as liz
+import numpy as np
+import pytest
+
+@pytest.fixture()
+def model():
+    model = liz.LizzyModel()
+    model.read_mesh_file("tests/test_meshes/Rect_1M_R1.msh")
+    model.assign_simulation_parameters(output_interval=100, end_step_when_sensor_triggered=True)
+    model.create_resin("resin", 0.1)
+    model.assign_resin("resin")
+    model.create_material("test_material", (1E-10, 1E-10, 1E-10), 0.5, 0.005)
+    model.assign_material("test_material", 'domain')
+    model.create_pressure_inlet("inlet_left", 1E+05)
+    model.assign_inlet("inlet_left", "left_edge")
+    return model
+
+def test_trigger_states_snapshot_unchanged(model: liz.LizzyModel):
+    model.create_sensor(0.2, 0.25, 0)
+    model.initialise_solver()
+    before = model.get_sensor_trigger_states()
+    snapshot = list(before)
+    model.solve()
+    after = model.get_sensor_trigger_states()
+    assert list(before) == snapshot == [False]
+    assert list(after) == [True]
+
+def test_histories_are_read_only(model: liz.LizzyModel):
+    model.create_sensor(0.5, 0.25, 0)
+    model.initialise_solver()
+    model.solve_time_interval(200)
+    sensor = model.get_sensor_by_id(0)
+    for history in (sensor.time_history, sensor.pressure_history, sensor.fill_factor_history, sensor.velocity_history):
+        with pytest.raises(ValueError):
+            history[0] = 1.0
+
+def test_histories_match_recorded_readings_after_growth(model: liz.LizzyModel):
+    # one write-out per second: ~2500 probes, well past the initial capacity of the histories
+    model.assign_simulation_parameters(output_interval=1)
+    model.create_sensor(0.5, 0.25, 0)
+    model.initialise_solver()
+    sensor = model.get_sensor_by_id(0)
+    model.solve_time_interval(200)
+    early_pressures = sensor.pressure_history
+    early_values = early_pressures.copy()
+    solution = model.solve(log="off")
+
+    # the sensor is probed at every saved time step, including the initial one
+    node_idx = sensor.child_node.idx
+    assert len(sensor.time_history) == solution.n_time_states > 1024
+    assert np.array_equal(sensor.time_history, solution.time)
+    assert np.array_equal(sensor.pressure_history, solution.p[:, node_idx])
+    assert np.array_equal(sensor.fill_factor_history, solution.fill_factor[:, node_idx])
+    assert np.array_equal(sensor.velocity_history, solution.v_nodal[:, node_idx])
+    assert sensor.time == sensor.time_history[-1]
+    assert sensor.pressure == sensor.pressure_history[-1]
+    # views taken before the histories grew keep their values
+    assert np.array_equal(early_pressures, early_values)
+    assert np.array_equal(sensor.pressure_history[:len(early_values)], early_values)